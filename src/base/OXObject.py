@@ -18,8 +18,9 @@ Key Features:
 
 Architecture:
     The OXObject class uses Python's dataclass decorator for automatic initialization and
-    the __post_init__ hook to set up class metadata. This ensures minimal overhead while
-    providing rich object identity features.
+    the __post_init__ hook to set up class metadata. The fully qualified class name is
+    computed once per class in __init_subclass__, so __post_init__ only copies a reference.
+    This ensures minimal overhead while providing rich object identity features.
 
 Usage:
     This class is not typically instantiated directly but serves as a base class:
@@ -38,13 +39,22 @@ Usage:
 Module Dependencies:
     - dataclasses: For automatic initialization and field management
     - uuid: For unique identifier generation
+    - os: For drawing random bytes for batches of identifiers
     - utilities.class_loaders: For fully qualified class name resolution
 """
 
+import os
+import sys
 from dataclasses import dataclass, field
 from uuid import UUID, uuid4
 
 
+def _short_type_name(class_name: str) -> str:
+    """Return the lowercased class name without its "ox" prefix."""
+    name = class_name.lower()
+    return name[2:] if name[:2] == "ox" else name
+
+
 @dataclass
 class OXObject:
     """
@@ -69,6 +79,7 @@ class OXObject:
         - **Unique Identity**: Each object gets a UUID that remains constant throughout its lifetime
         - **Type Information**: Automatic capture of fully qualified class names for debugging
         - **Hash Support**: Objects can be used in sets and as dictionary keys
+        - **Identity Equality**: Objects of the same class compare equal when their ids match
         - **String Representation**: Consistent, informative string representation
         - **Dataclass Integration**: Leverages Python dataclasses for efficient initialization
     
@@ -107,17 +118,53 @@ class OXObject:
     id: UUID = field(default_factory=uuid4)
     class_name: str = ""
 
+    def __init_subclass__(cls, **kwargs):
+        """Compute the fully qualified class name and the short type name once per class.
+
+        The name is interned and stored on the class so that every instance shares
+        the same string object. The short type name is the lowercased class name
+        without its "ox" prefix, as reported by
+        :meth:`base.OXObjectPot.OXObjectPot.get_object_types`. The format is the same as
+        :func:`utilities.class_loaders.get_fully_qualified_name`; it is built inline
+        because ``utilities.class_loaders`` depends on this package.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._ox_class_name = sys.intern(f"{cls.__module__}.{cls.__name__}")
+        cls._ox_type_name = _short_type_name(cls.__name__)
+        # Install identity-based comparison on the subclass itself; otherwise the
+        # @dataclass decorator generates a field-by-field __eq__ and drops __hash__.
+        if "__eq__" not in cls.__dict__:
+            cls.__eq__ = OXObject.__eq__
+        if "__hash__" not in cls.__dict__:
+            cls.__hash__ = OXObject.__hash__
+
+    @classmethod
+    def _batch_uuids(cls, n: int) -> list[UUID]:
+        """Draw ``n`` random version 4 UUIDs with a single ``os.urandom`` call.
+
+        The result is equivalent to ``[uuid4() for _ in range(n)]`` and is meant
+        for bulk construction paths that pass each id to the constructor.
+
+        Args:
+            n (int): The number of UUIDs to generate.
+
+        Returns:
+            list[UUID]: ``n`` random version 4 UUIDs.
+        """
+        buffer = os.urandom(16 * n)
+        return [UUID(bytes=buffer[i:i + 16], version=4) for i in range(0, 16 * n, 16)]
+
     def __post_init__(self):
         """Initialize the class_name attribute.
 
         This method is automatically called after the object is initialized.
-        It sets the class_name attribute to the fully qualified name of the object's class.
+        It sets the class_name attribute to the fully qualified name of the object's class,
+        which is precomputed when the class is defined.
 
         See Also:
             :func:`utilities.class_loaders.get_fully_qualified_name`
         """
-        from utilities.class_loaders import get_fully_qualified_name
-        self.class_name = get_fully_qualified_name(type(self))
+        self.class_name = type(self)._ox_class_name
 
     def __str__(self):
         """Return a string representation of the object.
@@ -135,6 +182,24 @@ class OXObject:
         """
         return self.__str__()
 
+    def __eq__(self, other):
+        """Compare two objects by type and id.
+
+        Two objects are equal when they are instances of the same class and share
+        the same id, which keeps equality consistent with :meth:`__hash__`. The
+        comparison does not touch any other field.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if both objects have the same class and id. NotImplemented
+                is returned for objects of a different class.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.id == other.id
+
     def __hash__(self):
         """Return a hash value for the object based on its id.
 
@@ -144,3 +209,7 @@ class OXObject:
             int: A hash value based on the object's id.
         """
         return hash(self.id)
+
+
+OXObject._ox_class_name = sys.intern(f"{OXObject.__module__}.{OXObject.__name__}")
+OXObject._ox_type_name = _short_type_name(OXObject.__name__)
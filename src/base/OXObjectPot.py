@@ -47,19 +47,91 @@ Usage:
 
 Module Dependencies:
     - collections.abc: For callable type hints and abstract base classes
+    - functools, keyword: For caching and validating generated search loops and wrapping list methods
     - dataclasses: For dataclass functionality and field definitions
     - uuid: For UUID type annotations and handling
     - base.OXception: For custom exception handling
     - base.OXObject: For base object functionality
 """
 
-from collections.abc import Callable
+import keyword
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from typing import ClassVar
 from uuid import UUID
 
 from base.OXObject import OXObject
 from base.OXception import OXception
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _compile_search(keys: tuple[str, ...]) -> Callable[..., list[OXObject]]:
+    """Generate a search loop specialised for one tuple of attribute names.
+
+    The generated function reads each attribute with a direct attribute access
+    instead of ``getattr`` with a string key and takes the expected values as
+    positional arguments. It is cached per tuple of keys, so repeated searches
+    with the same shape of criteria reuse it.
+
+    Args:
+        keys (tuple[str, ...]): Attribute names, in the order they are compared.
+            Every name must be a valid identifier that is not a keyword.
+
+    Returns:
+        Callable[..., list[OXObject]]: A function ``(objects, *values)`` returning the
+            objects whose attributes compare equal to the given values. Objects
+            missing any of the attributes are skipped.
+    """
+    parameters = ", ".join(f"v{i}" for i in range(len(keys)))
+    condition = " or ".join(f"o.{key} != v{i}" for i, key in enumerate(keys))
+    source = (
+        f"def _search(objects, {parameters}):\n"
+        f"    result = []\n"
+        f"    for o in objects:\n"
+        f"        try:\n"
+        f"            if {condition}:\n"
+        f"                continue\n"
+        f"        except AttributeError:\n"
+        f"            continue\n"
+        f"        result.append(o)\n"
+        f"    return result\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["_search"]
+
+
+class _ObjectList(list):
+    """A list that counts the changes made to it.
+
+    OXObjectPot compares the counter with the one recorded when its id index was
+    built, so edits made directly on ``pot.objects`` (item assignment, slicing,
+    ``append``, ``sort`` and so on) are picked up by the next lookup.
+    """
+    version = 0
+
+
+def _counting(name: str) -> Callable:
+    """Wrap a mutating ``list`` method so that it bumps ``_ObjectList.version``."""
+    method = getattr(list, name)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.version += 1
+        return result
+    return wrapper
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_ObjectList, _name, _counting(_name))
+del _name
+
 
 @dataclass
 class OXObjectPot(OXObject):
@@ -91,6 +163,7 @@ class OXObjectPot(OXObject):
     Search Methods:
         - ``search(**kwargs)``: Find objects matching specific attribute values
         - ``search_by_function(func)``: Find objects satisfying a custom predicate
+        - ``search_by_function_iter(func)``: Lazily yield objects satisfying a predicate
         - ``__getitem__(uuid)``: Direct UUID-based lookup
         - ``__contains__(obj)``: Check if object or UUID exists in container
     
@@ -152,15 +225,138 @@ class OXObjectPot(OXObject):
     
     Note:
         - Objects are stored by reference, so modifications to objects affect the container
-        - UUID-based access is O(n) as it performs linear search
-        - For large collections, consider maintaining additional index structures
+        - UUID-based access is O(1) through an id index that is rebuilt whenever the
+          default ``objects`` list changes; a list assigned from outside is scanned instead
+        - Attribute search is a linear scan because attribute values are mutable and,
+          for scenario-aware objects, depend on the active scenario
         - The container does not enforce uniqueness - duplicate objects can be added
     """
-    objects: list[OXObject] = field(default_factory=list)
+    objects: list[OXObject] = field(default_factory=_ObjectList)
+
+    #: Type every stored object must have. Specialized containers narrow it.
+    _accepted_type: ClassVar[type] = object
+    #: Message of the OXception raised when an object of another type is added.
+    _reject_message: ClassVar[str] = "Object type not accepted by this container"
+
+    def __post_init__(self):
+        """Initialize the id index, type counts and snapshot kept alongside ``objects``.
+
+        These structures are kept outside the dataclass fields so that they are
+        neither serialized nor compared. They are tied to the identity and change
+        counter of the default ``objects`` list, so any change to that list
+        triggers a rebuild on the next access. A plain list assigned to
+        ``objects`` (as the deserializer does) has no counter and is scanned instead.
+        """
+        super().__post_init__()
+        self._by_id: dict[UUID, OXObject] = {}
+        self._type_counts: Counter[str] = Counter()
+        self._indexed_objects: list[OXObject] | None = None
+        self._indexed_version = 0
+        self._snapshot: tuple[OXObject, ...] | None = None
+        self._snapshot_source: list[OXObject] | None = None
+        self._snapshot_version = 0
+        self._ids: tuple[UUID, ...] = ()
+        self._ids_source: tuple[OXObject, ...] | None = None
+
+    def _in_sync(self) -> bool:
+        """Return True if the id index and type counts describe ``objects`` as it is now."""
+        objects = self.objects
+        return (self._indexed_objects is objects and isinstance(objects, _ObjectList)
+                and self._indexed_version == objects.version)
+
+    def _sync_indexes(self) -> bool:
+        """Rebuild the id index and type counts if they went stale.
+
+        When the same id is stored more than once, the id index keeps the first
+        object, which matches the order of a linear scan over ``objects``.
+
+        Returns:
+            bool: False if ``objects`` is not a change-counting list, in which case
+                no index is kept and callers must scan ``objects`` instead.
+        """
+        objects = self.objects
+        if not isinstance(objects, _ObjectList):
+            return False
+        if self._indexed_objects is not objects or self._indexed_version != objects.version:
+            index = {}
+            for obj in objects:
+                index.setdefault(obj.id, obj)
+            self._by_id = index
+            self._type_counts = Counter(obj._ox_type_name for obj in objects)
+            self._indexed_objects = objects
+            self._indexed_version = objects.version
+        return True
+
+    def _find(self, id: UUID) -> OXObject | None:
+        """Return the first object with the given id, or None if there is none.
+
+        Args:
+            id (UUID): The id to look up.
+
+        Returns:
+            OXObject | None: The object found through the id index, or through a
+                linear scan when ``objects`` has no index.
+        """
+        if self._sync_indexes():
+            return self._by_id.get(id)
+        for object in self.objects:
+            if object.id == id:
+                return object
+        return None
+
+    def as_tuple(self) -> tuple[OXObject, ...]:
+        """Return an immutable snapshot of the objects in the pot.
+
+        The snapshot is cached and handed out again until the objects list
+        changes, so repeated reads of an unchanged pot do not copy it. A plain
+        list assigned to ``objects`` cannot report its changes and is copied on
+        every call.
+
+        Returns:
+            tuple[OXObject, ...]: The objects in insertion order.
+
+        Examples:
+            >>> pot.as_tuple() is pot.as_tuple()
+            True
+        """
+        objects = self.objects
+        if not isinstance(objects, _ObjectList):
+            return tuple(objects)
+        snapshot = self._snapshot
+        if snapshot is None or self._snapshot_source is not objects or self._snapshot_version != objects.version:
+            snapshot = self._snapshot = tuple(objects)
+            self._snapshot_source = objects
+            self._snapshot_version = objects.version
+        return snapshot
+
+    def ids(self) -> tuple[UUID, ...]:
+        """Return the ids of the objects in the pot.
+
+        The ids are derived from :meth:`as_tuple` and cached with its snapshot,
+        so they are rebuilt whenever the objects list changes and repeated reads
+        of an unchanged pot return the same tuple without touching the objects.
+
+        Returns:
+            tuple[UUID, ...]: The object ids in insertion order.
+
+        Examples:
+            >>> pot.ids() == tuple(obj.id for obj in pot)
+            True
+        """
+        snapshot = self.as_tuple()
+        if self._ids_source is not snapshot:
+            self._ids = tuple(obj.id for obj in snapshot)
+            self._ids_source = snapshot
+        return self._ids
 
     def search(self, **kwargs) -> list[OXObject]:
         """Search for objects with matching attribute values.
 
+        Attribute values are read at call time, so objects that were modified
+        after being added (or scenario-aware objects after a scenario switch)
+        are matched against their current values. The scan is generated once
+        per combination of attribute names and reused by later searches.
+
         Args:
             **kwargs: Attribute-value pairs to match against objects.
                 An object is included in the result if it has all the specified
@@ -173,14 +369,18 @@ class OXObjectPot(OXObject):
             >>> pot.search(name="variable1", lower_bound=0)
             [OXVariable(12345678-1234-5678-1234-567812345678)]
         """
+        keys = tuple(kwargs)
+        if not keys:
+            return list(self.objects)
+        if all(key.isidentifier() and not keyword.iskeyword(key) for key in keys):
+            return _compile_search(keys)(self.objects, *kwargs.values())
+        criteria = tuple(kwargs.items())
         result = []
         for object in self.objects:
-            should_include = True
-            for key, value in kwargs.items():
-                if not hasattr(object, key) or getattr(object, key) != value:
-                    should_include = False
+            for key, value in criteria:
+                if getattr(object, key, _MISSING) != value:
                     break
-            if should_include:
+            else:
                 result.append(object)
         return result
 
@@ -198,19 +398,105 @@ class OXObjectPot(OXObject):
             >>> pot.search_by_function(lambda x: x.name.startswith("var"))
             [OXVariable(12345678-1234-5678-1234-567812345678)]
         """
-        result = []
+        return [object for object in self.objects if function(object)]
+
+    def search_by_function_iter(self, function: Callable[[OXObject], bool]) -> Iterator[OXObject]:
+        """Lazily yield the objects that satisfy a given predicate function.
+
+        This is the generator counterpart of :meth:`search_by_function` for callers
+        that consume the matches once, such as building a list of ids, and do not
+        need the intermediate list of objects.
+
+        Args:
+            function (Callable[[OXObject], bool]): A function that takes an OXObject
+                and returns True if the object should be yielded.
+
+        Yields:
+            OXObject: The objects for which the function returns True, in insertion order.
+
+        Examples:
+            >>> [v.id for v in pot.search_by_function_iter(lambda x: x.upper_bound > 5)]
+            [UUID('12345678-1234-5678-1234-567812345678')]
+        """
         for object in self.objects:
             if function(object):
-                result.append(object)
-        return result
+                yield object
+
+    def _check_accepted(self, obj: OXObject):
+        """Make sure an object may be stored in this container.
+
+        Args:
+            obj (OXObject): The object about to be added.
+
+        Raises:
+            OXception: If the object is not an instance of ``_accepted_type``.
+        """
+        if not isinstance(obj, self._accepted_type):
+            raise OXception(self._reject_message)
 
     def add_object(self, obj: OXObject):
         """Add an object to the pot.
 
         Args:
             obj (OXObject): The object to add.
+
+        Raises:
+            OXception: If the object is not of the type this container accepts.
         """
+        self._check_accepted(obj)
+        in_sync = self._in_sync()
         self.objects.append(obj)
+        if in_sync:
+            self._by_id.setdefault(obj.id, obj)
+            self._type_counts[obj._ox_type_name] += 1
+            self._indexed_version = self.objects.version
+
+    def extend_objects(self, objs: Iterable[OXObject]):
+        """Add several objects to the pot in one pass.
+
+        This is equivalent to calling :meth:`add_object` for each object, but the
+        objects are appended with a single ``list.extend`` and the id index and
+        type counts are updated in one loop. All objects are validated before
+        any of them is added, so a rejected batch leaves the pot unchanged.
+
+        Args:
+            objs (Iterable[OXObject]): The objects to add, in order.
+
+        Raises:
+            OXception: If any of the objects is not of the type this container accepts.
+
+        Examples:
+            >>> pot = OXObjectPot()
+            >>> pot.extend_objects([OXObject(), OXObject()])
+            >>> len(pot)
+            2
+        """
+        objs = list(objs)
+        for obj in objs:
+            self._check_accepted(obj)
+        in_sync = self._in_sync()
+        self.objects.extend(objs)
+        if in_sync:
+            by_id = self._by_id
+            type_counts = self._type_counts
+            for obj in objs:
+                by_id.setdefault(obj.id, obj)
+                type_counts[obj._ox_type_name] += 1
+            self._indexed_version = self.objects.version
+
+    def clear(self):
+        """Remove all objects from the pot.
+
+        The ``objects`` list is emptied in place, so references to it held
+        elsewhere stay valid. The id index and type counts are rebuilt from the
+        empty list on the next access.
+
+        Examples:
+            >>> pot.clear()
+            >>> len(pot)
+            0
+        """
+        self.objects.clear()
 
     def remove_object(self, obj: OXObject):
         """Remove an object from the pot.
@@ -224,7 +510,7 @@ class OXObjectPot(OXObject):
         self.objects.remove(obj)
 
     def __getitem__(self, item):
-        """Get an object by its UUID.
+        """Get an object by its UUID, in constant time when the id index is kept.
 
         Args:
             item (UUID): The UUID of the object to retrieve.
@@ -245,10 +531,10 @@ class OXObjectPot(OXObject):
         """
         if not isinstance(item, UUID):
             raise OXception("Only UUID indices are accepted")
-        for object in self.objects:
-            if object.id == item:
-                return object
-        raise OXception("Object not found")
+        obj = self._find(item)
+        if obj is None:
+            raise OXception("Object not found")
+        return obj
 
     def __iter__(self):
         """Return an iterator over the objects in the pot.
@@ -267,23 +553,17 @@ class OXObjectPot(OXObject):
         return len(self.objects)
 
     def __contains__(self, obj: OXObject) -> bool:
-        """Check if an object is in the pot.
+        """Check if an object or an object UUID is in the pot, in constant time when the id index is kept.
 
         Args:
-            obj (OXObject): The object to check.
+            obj (OXObject | UUID): The object or UUID to check.
 
         Returns:
             bool: True if the object is in the pot, False otherwise.
         """
-        if isinstance(obj, UUID):
-            for object in self.objects:
-                if object.id == obj:
-                    return True
-        else:
-            for object in self.objects:
-                if object.id == obj.id:
-                    return True
-        return False
+        if not isinstance(obj, UUID):
+            obj = obj.id
+        return self._find(obj) is not None
 
     @property
     def last_object(self):
@@ -326,20 +606,17 @@ class OXObjectPot(OXObject):
     def get_object_types(self) -> list[str]:
         """Get a list of the types of objects in the pot.
 
-        The type names are derived from the class_name attribute of each object,
-        with the "OX" prefix removed and converted to lowercase.
+        The type names are derived from the class of each object, with the "OX"
+        prefix removed and converted to lowercase. The names are counted alongside
+        the id index, so the call does not rescan an unchanged pot.
 
         Returns:
-            list[str]: A list of unique object type names.
+            list[str]: A list of unique object type names, in order of first appearance.
 
         Examples:
             >>> pot.get_object_types()
             ['variable', 'constraint']
         """
-        result = set()
-        for obj in self.objects:
-            temp_class_name = obj.class_name[(obj.class_name.rfind(".") + 1):].lower()
-            if temp_class_name[:2] == "ox":
-                temp_class_name = temp_class_name[2:]
-            result.add(temp_class_name)
-        return list(result)
+        if self._sync_indexes():
+            return list(self._type_counts)
+        return list(dict.fromkeys(obj._ox_type_name for obj in self.objects))
@@ -17,13 +17,13 @@ Key Features:
     - **Variable State Logging**: Records local variables at the time of exception
     - **Relative Path Resolution**: Converts absolute paths to relative paths for cleaner error messages
     - **JSON Serialization**: Supports conversion to JSON for structured logging and error reporting
-    - **Stack Frame Analysis**: Uses Python's inspect module for detailed stack frame information
+    - **Stack Frame Analysis**: Reads the raising frame directly for its code location and locals
     - **Debugging Support**: Enhanced string representation for comprehensive error details
 
 Architecture:
-    The OXception class uses Python's inspect module to analyze the call stack at the time
-    of exception creation. It automatically extracts context information from the calling
-    frame and formats it for easy debugging. The relative path calculation ensures that
+    The OXception class reads the calling frame with sys._getframe at the time of
+    exception creation. It extracts context information from that single frame without
+    walking the rest of the stack and formats it for easy debugging. The relative path calculation ensures that
     error messages are portable across different development environments.
 
 Usage:
@@ -48,14 +48,31 @@ Usage:
             error_data = e.to_json()
 
 Module Dependencies:
-    - inspect: For stack frame analysis and context capture
+    - sys: For access to the calling stack frame
+    - functools: For caching relative paths per source file
     - pathlib: For file path manipulation and relative path calculation
 """
 
-import inspect
+import functools
+import sys
 from pathlib import Path
 
 
+_PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
+
+
+@functools.lru_cache(maxsize=1024)
+def _relative_file_name(file_path: str) -> str:
+    """Return ``file_path`` relative to the project root.
+
+    The set of source files that raise is small, so results are cached per path.
+
+    Raises:
+        ValueError: If the file is not inside the project root.
+    """
+    return str(Path(file_path).relative_to(_PROJECT_ROOT))
+
+
 class OXception(Exception):
     """
     Enhanced exception class for the OptiX mathematical optimization framework.
@@ -149,14 +166,11 @@ class OXception(Exception):
             message (str): The error message.
         """
         self.message = message
-        frm = inspect.currentframe()
-        self.line_nr = frm.f_back.f_lineno
-        current_path = Path(__file__).parent.parent.parent.absolute()
-        error_file_path = Path(frm.f_back.f_code.co_filename)
-        relative_path = error_file_path.relative_to(current_path)
-        self.file_name = str(relative_path)
-        self.method_name = frm.f_back.f_code.co_name
-        self.params = {k:v for k,v in frm.f_back.f_locals.items()}
+        frm = sys._getframe(1)
+        self.line_nr = frm.f_lineno
+        self.file_name = _relative_file_name(frm.f_code.co_filename)
+        self.method_name = frm.f_code.co_name
+        self.params = dict(frm.f_locals)
         super().__init__(self.message)
 
     def to_json(self):
@@ -98,6 +98,8 @@ from .OXpression import OXpression
 NON_SCENARIO_FIELDS = ["active_scenario", "scenarios", "id", "class_name", "positive_deviation_variable",
                        "negative_deviation_variable", "expression"]
 
+_NON_SCENARIO_FIELD_SET = frozenset(NON_SCENARIO_FIELDS)
+
 
 class RelationalOperators(StrEnum):
     """Enumeration of relational operators for constraints.
@@ -119,6 +121,26 @@ class RelationalOperators(StrEnum):
     LESS_THAN_EQUAL = "<="
 
 
+#: Maps inequality operators to the ``(negative_desired, positive_desired)`` flags of the
+#: deviation variables created by :meth:`OXConstraint.to_goal`. Equality constraints are
+#: absent because neither deviation is desired and their bounds are left untouched.
+_GOAL_DESIRABILITY = {
+    RelationalOperators.LESS_THAN: (True, False),
+    RelationalOperators.LESS_THAN_EQUAL: (True, False),
+    RelationalOperators.GREATER_THAN: (False, True),
+    RelationalOperators.GREATER_THAN_EQUAL: (False, True),
+}
+
+#: Maps each inequality operator to the operator of its negation, as used by
+#: :meth:`OXConstraint.reverse`.
+_REVERSED_OPERATORS = {
+    RelationalOperators.GREATER_THAN: RelationalOperators.LESS_THAN_EQUAL,
+    RelationalOperators.GREATER_THAN_EQUAL: RelationalOperators.LESS_THAN,
+    RelationalOperators.LESS_THAN: RelationalOperators.GREATER_THAN_EQUAL,
+    RelationalOperators.LESS_THAN_EQUAL: RelationalOperators.GREATER_THAN
+}
+
+
 @dataclass
 class OXConstraint(OXObject):
     """A constraint in an optimization problem with scenario support.
@@ -204,7 +226,7 @@ class OXConstraint(OXObject):
             >>> constraint.active_scenario = "High_RHS"
             >>> print(constraint.rhs)  # 150 (from scenario)
         """
-        if item in NON_SCENARIO_FIELDS:  # Prevent Infinite Loop!
+        if item in _NON_SCENARIO_FIELD_SET:  # Prevent Infinite Loop!
             return super().__getattribute__(item)
 
         # Check if item is a dataclass field
@@ -306,12 +328,7 @@ class OXConstraint(OXObject):
         """
         if self.relational_operator == RelationalOperators.EQUAL:
             raise OXception("Cannot reverse an equality constraint.")
-        reversed_operator = {
-            RelationalOperators.GREATER_THAN: RelationalOperators.LESS_THAN_EQUAL,
-            RelationalOperators.GREATER_THAN_EQUAL: RelationalOperators.LESS_THAN,
-            RelationalOperators.LESS_THAN: RelationalOperators.GREATER_THAN_EQUAL,
-            RelationalOperators.LESS_THAN_EQUAL: RelationalOperators.GREATER_THAN
-        }[self.relational_operator]
+        reversed_operator = _REVERSED_OPERATORS[self.relational_operator]
 
         return OXConstraint(
             expression=self.expression,
@@ -344,27 +361,38 @@ class OXConstraint(OXObject):
         The conversion sets the relational operator to EQUAL and sets the
         desired deviation variables based on the original operator.
 
+        Args:
+            upper_bound (int | float | Fraction): Upper bound of both deviation
+                variables when the original constraint is an inequality. Deviation
+                variables of equality constraints stay unbounded.
+
         Returns:
             OXGoalConstraint: A new goal constraint based on this constraint.
 
         See Also:
             :class:`OXGoalConstraint`
         """
-        result = OXGoalConstraint()
-        result.expression = self.expression
-        result.relational_operator = RelationalOperators.EQUAL
-        result.rhs = self.rhs
-        result.name = self.name
-        result.positive_deviation_variable.name = f"Positive deviation of {self.name}"
-        result.negative_deviation_variable.name = f"Negative deviation of {self.name}"
-        if self.relational_operator in [RelationalOperators.LESS_THAN, RelationalOperators.LESS_THAN_EQUAL]:
-            result.negative_deviation_variable.desired = True
-            result.negative_deviation_variable.upper_bound = upper_bound
-            result.positive_deviation_variable.upper_bound = upper_bound
-        elif self.relational_operator in [RelationalOperators.GREATER_THAN, RelationalOperators.GREATER_THAN_EQUAL]:
-            result.positive_deviation_variable.desired = True
-            result.positive_deviation_variable.upper_bound = upper_bound
-            result.negative_deviation_variable.upper_bound = upper_bound
+        name = self.name
+        negative_desired, positive_desired = False, False
+        deviation_upper_bound = float("inf")
+        goal_flags = _GOAL_DESIRABILITY.get(self.relational_operator)
+        if goal_flags is not None:
+            negative_desired, positive_desired = goal_flags
+            deviation_upper_bound = upper_bound
+        # Build every part with its final values; default-constructing the goal and
+        # overwriting its fields would create a throwaway expression and name strings.
+        result = OXGoalConstraint(
+            expression=self.expression,
+            relational_operator=RelationalOperators.EQUAL,
+            rhs=self.rhs,
+            name=name,
+            positive_deviation_variable=OXDeviationVar(name=f"Positive deviation of {name}",
+                                                       upper_bound=deviation_upper_bound,
+                                                       desired=positive_desired),
+            negative_deviation_variable=OXDeviationVar(name=f"Negative deviation of {name}",
+                                                       upper_bound=deviation_upper_bound,
+                                                       desired=negative_desired),
+        )
         return result
 
 
@@ -403,12 +431,7 @@ class OXGoalConstraint(OXConstraint):
         Returns:
             list[OXDeviationVar]: A list of deviation variables marked as desired.
         """
-        result = []
-        if self.positive_deviation_variable.desired:
-            result.append(self.positive_deviation_variable)
-        if self.negative_deviation_variable.desired:
-            result.append(self.negative_deviation_variable)
-        return result
+        return self._select_deviation_variables(True)
 
     @property
     def undesired_variables(self) -> list[OXDeviationVar]:
@@ -417,9 +440,23 @@ class OXGoalConstraint(OXConstraint):
         Returns:
             list[OXDeviationVar]: A list of deviation variables not marked as desired.
         """
-        result = []
-        if not self.positive_deviation_variable.desired:
-            result.append(self.positive_deviation_variable)
-        if not self.negative_deviation_variable.desired:
-            result.append(self.negative_deviation_variable)
-        return result
+        return self._select_deviation_variables(False)
+
+    def _select_deviation_variables(self, desired: bool) -> list[OXDeviationVar]:
+        """Select the deviation variables whose desired flag matches the given value.
+
+        Each deviation variable is read once and the result list is built in a single
+        step, positive deviation first.
+
+        Args:
+            desired (bool): The desired flag to match.
+
+        Returns:
+            list[OXDeviationVar]: The matching deviation variables.
+        """
+        positive = self.positive_deviation_variable
+        negative = self.negative_deviation_variable
+        take_negative = bool(negative.desired) == desired
+        if bool(positive.desired) == desired:
+            return [positive, negative] if take_negative else [positive]
+        return [negative] if take_negative else []
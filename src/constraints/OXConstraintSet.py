@@ -53,6 +53,7 @@ Example:
 """
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 from base import OXObjectPot, OXObject, OXception
 from .OXConstraint import OXConstraint
@@ -106,29 +107,8 @@ class OXConstraintSet(OXObjectPot):
         >>> for constraint in capacity_set:
         ...     print(f"Constraint: {constraint.name}")
     """
-
-    def add_object(self, obj: OXObject):
-        """Add an OXConstraint object to the constraint set.
-
-        This method provides type-safe addition of constraint objects to the set.
-        Only OXConstraint instances are allowed to be added to maintain the
-        integrity of the constraint set.
-
-        Args:
-            obj (OXObject): The constraint object to add. Must be an instance of OXConstraint.
-
-        Raises:
-            OXception: If the object is not an instance of OXConstraint.
-
-        Examples:
-            >>> constraint_set = OXConstraintSet()
-            >>> constraint = OXConstraint(...)
-            >>> constraint_set.add_object(constraint)
-            >>> print(len(constraint_set))  # 1
-        """
-        if not isinstance(obj, OXConstraint):
-            raise OXception("Only OXConstraint can be added to OXConstraintSet")
-        super().add_object(obj)
+    _accepted_type: ClassVar[type] = OXConstraint
+    _reject_message: ClassVar[str] = "Only OXConstraint can be added to OXConstraintSet"
 
     def remove_object(self, obj: OXObject):
         """Remove an OXConstraint object from the constraint set.
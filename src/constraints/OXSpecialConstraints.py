@@ -68,6 +68,7 @@ Example:
 """
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 from uuid import UUID, uuid4
 
 from base import OXObject
@@ -127,7 +128,9 @@ class OXMultiplicativeEqualityConstraint(OXNonLinearEqualityConstraint):
     of all input variables: output_variable = input_variable_1 * input_variable_2 * ... * input_variable_n
 
     Attributes:
-        input_variables (list[UUID]): The list of variable UUIDs to multiply.
+        input_variables (tuple[UUID, ...]): The variable UUIDs to multiply. Any iterable
+            passed to the constructor is stored as a tuple. The deserializer assigns
+            fields after construction, so a rebuilt constraint holds the decoded list.
         output_variable (UUID): The UUID of the variable that stores the product.
             Inherited from OXNonLinearEqualityConstraint.
 
@@ -142,11 +145,38 @@ class OXMultiplicativeEqualityConstraint(OXNonLinearEqualityConstraint):
         This constraint is typically handled by constraint programming solvers
         that support non-linear operations.
     """
-    input_variables: list[UUID] = field(default_factory=list)
+    input_variables: tuple[UUID, ...] = ()
+
+    def __post_init__(self):
+        """Store the input variables as an immutable tuple."""
+        super().__post_init__()
+        self.input_variables = tuple(self.input_variables)
 
 
 @dataclass
-class OXDivisionEqualityConstraint(OXNonLinearEqualityConstraint):
+class _OXDivModEqualityConstraint(OXNonLinearEqualityConstraint):
+    """Shared fields of the division and modulo equality constraints.
+
+    Both constraints relate one input variable to the output variable through
+    an integer denominator and differ only in the operation applied, which
+    ``operator_symbol`` names.
+
+    Attributes:
+        input_variable (UUID): The UUID of the variable to operate on.
+        denominator (int): The divisor of the operation.
+        output_variable (UUID): The UUID of the variable that stores the result.
+            Inherited from OXNonLinearEqualityConstraint.
+        operator_symbol (ClassVar[str]): The Python operator of the operation, such as
+            ``"/"``. It is used when naming the output variable and is not serialized.
+    """
+    operator_symbol: ClassVar[str] = ""
+
+    input_variable: UUID = field(default_factory=uuid4)
+    denominator: int = 1
+
+
+@dataclass
+class OXDivisionEqualityConstraint(_OXDivModEqualityConstraint):
     """A constraint representing integer division of a variable.
 
     This constraint enforces that the output variable equals the integer division
@@ -156,7 +186,8 @@ class OXDivisionEqualityConstraint(OXNonLinearEqualityConstraint):
         input_variable (UUID): The UUID of the variable to divide.
         denominator (int): The divisor for the division operation.
         output_variable (UUID): The UUID of the variable that stores the quotient.
-            Inherited from OXNonLinearEqualityConstraint.
+
+        All three fields are inherited from _OXDivModEqualityConstraint.
 
     Examples:
         >>> # Create a constraint: z = x // 3
@@ -170,12 +201,11 @@ class OXDivisionEqualityConstraint(OXNonLinearEqualityConstraint):
         This constraint performs integer division (floor division), not
         floating-point division.
     """
-    input_variable: UUID = field(default_factory=uuid4)
-    denominator: int = 1
+    operator_symbol: ClassVar[str] = "/"
 
 
 @dataclass
-class OXModuloEqualityConstraint(OXNonLinearEqualityConstraint):
+class OXModuloEqualityConstraint(_OXDivModEqualityConstraint):
     """A constraint representing modulo operation on a variable.
 
     This constraint enforces that the output variable equals the remainder
@@ -185,7 +215,8 @@ class OXModuloEqualityConstraint(OXNonLinearEqualityConstraint):
         input_variable (UUID): The UUID of the variable to apply modulo to.
         denominator (int): The divisor for the modulo operation.
         output_variable (UUID): The UUID of the variable that stores the remainder.
-            Inherited from OXNonLinearEqualityConstraint.
+
+        All three fields are inherited from _OXDivModEqualityConstraint.
 
     Examples:
         >>> # Create a constraint: z = x % 5
@@ -198,8 +229,7 @@ class OXModuloEqualityConstraint(OXNonLinearEqualityConstraint):
     Note:
         The result is always non-negative and less than the denominator.
     """
-    input_variable: UUID = field(default_factory=uuid4)
-    denominator: int = 1
+    operator_symbol: ClassVar[str] = "%"
 
 
 @dataclass
@@ -210,7 +240,9 @@ class OXSummationEqualityConstraint(OXSpecialConstraint):
     of all input variables: output_variable = input_variable_1 + input_variable_2 + ... + input_variable_n
 
     Attributes:
-        input_variables (list[UUID]): The list of variable UUIDs to sum.
+        input_variables (tuple[UUID, ...]): The variable UUIDs to sum. Any iterable
+            passed to the constructor is stored as a tuple. The deserializer assigns
+            fields after construction, so a rebuilt constraint holds the decoded list.
         output_variable (UUID): The UUID of the variable that stores the sum.
 
     Examples:
@@ -224,9 +256,14 @@ class OXSummationEqualityConstraint(OXSpecialConstraint):
         While this could be expressed as a linear constraint, it's included
         as a special constraint for consistency and solver optimization.
     """
-    input_variables: list[UUID] = field(default_factory=list)
+    input_variables: tuple[UUID, ...] = ()
     output_variable: UUID = field(default_factory=uuid4)
 
+    def __post_init__(self):
+        """Store the input variables as an immutable tuple."""
+        super().__post_init__()
+        self.input_variables = tuple(self.input_variables)
+
 
 @dataclass
 class OXConditionalConstraint(OXSpecialConstraint):
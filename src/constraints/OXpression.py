@@ -62,11 +62,13 @@ Example:
             print(f"Variable {var_id}: coefficient {weight}")
 """
 import math
+from array import array
 from dataclasses import dataclass, field
 from fractions import Fraction
 from uuid import UUID
 
 from base import OXObject
+from utilities.DynamicValue import DynamicFloat
 from utilities.fraction import calculate_fraction
 
 
@@ -130,12 +132,8 @@ def get_integer_numerator_and_denominators(numbers: list[float | int]) -> tuple[
         math.lcm: Used to find the least common multiple of denominators
     """
     fractional_weights = [calculate_fraction(value=w) if not isinstance(w, Fraction) else w for w in numbers]
-    denominators = [fw.denominator for fw in fractional_weights]
-    numerator = [fw.numerator for fw in fractional_weights]
-    common_multiple = math.lcm(*denominators)
-    factors = [common_multiple // n for n in denominators]
-    numerator = [n * f for n, f in zip(numerator, factors)]
-    return common_multiple, numerator
+    common_multiple = math.lcm(*(fw.denominator for fw in fractional_weights))
+    return common_multiple, [fw.numerator * (common_multiple // fw.denominator) for fw in fractional_weights]
 
 
 @dataclass
@@ -228,6 +226,32 @@ class OXpression(OXObject):
     variables: list[UUID] = field(default_factory=list)
     weights: list[float | int | Fraction] = field(default_factory=list)
 
+    def __post_init__(self):
+        """Initialize the cache of the integer form kept alongside ``weights``.
+
+        The cache is kept outside the dataclass fields so that it is neither
+        serialized nor compared.
+        """
+        super().__post_init__()
+        self._integer_form_key: tuple | None = None
+        self._integer_form: tuple[int, list[int]] = (1, [])
+
+    def _integer_form_of_weights(self) -> tuple[int, list[int]]:
+        """Return the common denominator and integer numerators of the weights.
+
+        The result is cached until the weights change. Dynamic weights are read
+        through their current value, so a scenario switch is seen as a change.
+
+        Returns:
+            tuple[int, list[int]]: The output of
+                :func:`get_integer_numerator_and_denominators` for the weights.
+        """
+        key = tuple(w.value if isinstance(w, DynamicFloat) else w for w in self.weights)
+        if key != self._integer_form_key:
+            self._integer_form = get_integer_numerator_and_denominators(key)
+            self._integer_form_key = key
+        return self._integer_form
+
     @property
     def number_of_variables(self) -> int:
         """
@@ -308,7 +332,7 @@ class OXpression(OXObject):
             integer_denominator: Get the common denominator for these integer weights
             get_integer_numerator_and_denominators: The underlying conversion function
         """
-        return get_integer_numerator_and_denominators(self.weights)[1]
+        return list(self._integer_form_of_weights()[1])
 
     @property
     def integer_denominator(self) -> int:
@@ -362,7 +386,7 @@ class OXpression(OXObject):
             integer_weights: Get the integer numerators for these coefficients
             get_integer_numerator_and_denominators: The underlying conversion function
         """
-        return get_integer_numerator_and_denominators(self.weights)[0]
+        return self._integer_form_of_weights()[0]
 
     def __iter__(self):
         """
@@ -421,3 +445,21 @@ class OXpression(OXObject):
                        (this would indicate a malformed expression)
         """
         return iter(zip(self.variables, self.weights))
+
+    def weights_array(self) -> array:
+        """Return the weights as a contiguous column of doubles.
+
+        The ``weights`` list itself keeps the caller's numeric types so that
+        Fraction coefficients stay exact for :attr:`integer_weights`. Solvers that
+        only need floating-point coefficients can use this column instead; being
+        an ``array('d')``, it exposes the buffer protocol and can be wrapped
+        without copying, e.g. ``numpy.frombuffer(expr.weights_array())``.
+
+        Returns:
+            array: A snapshot of the weights converted to float, ordered like ``variables``.
+
+        Examples:
+            >>> OXpression(variables=[x.id, y.id], weights=[1, Fraction(1, 2)]).weights_array()
+            array('d', [1.0, 0.5])
+        """
+        return array("d", [float(w) for w in self.weights])
@@ -21,6 +21,8 @@ Architecture:
     The OXData class uses Python's ``__getattribute__`` method to implement transparent
     scenario switching. When an attribute is accessed, the system first checks the active
     scenario for that attribute, falling back to the object's base attributes if not found.
+    Reads go straight to the instance dictionary for ``scenarios`` and ``active_scenario``,
+    so edits made directly on ``scenarios`` are seen by the next read.
 
 Example:
     Basic usage of OXData with multiple scenarios:
@@ -68,6 +70,8 @@ from utilities.DynamicValue import DynamicFloat
 #: and maintain object integrity. These fields are always accessed from the base object.
 NON_SCENARIO_FIELDS = ["active_scenario", "scenarios", "id", "class_name"]
 
+_NON_SCENARIO_FIELD_SET = frozenset(NON_SCENARIO_FIELDS)
+
 
 @dataclass
 class OXData(OXObject):
@@ -114,7 +118,7 @@ class OXData(OXObject):
             Any: The value of the attribute in the active scenario, or the
                 object's own attribute if not found in the active scenario.
         """
-        if item in NON_SCENARIO_FIELDS:  # Prevent Infinite Loop!
+        if item in _NON_SCENARIO_FIELD_SET:  # Prevent Infinite Loop!
             return super().__getattribute__(item)
 
         # Check if item is a dataclass field
@@ -123,9 +127,9 @@ class OXData(OXObject):
             return super().__getattribute__(item)
 
         def get_current_value():
-            current_scenarios = super(OXData, self).__getattribute__('scenarios')
-            current_active = super(OXData, self).__getattribute__('active_scenario')
-            current_scenario_values = current_scenarios.get(current_active, {})
+            instance_values = object.__getattribute__(self, '__dict__')
+            current_scenarios = instance_values.get('scenarios')
+            current_scenario_values = current_scenarios.get(instance_values.get('active_scenario')) if current_scenarios else None
 
             if current_scenario_values and item in current_scenario_values:
                 return current_scenario_values[item]
@@ -67,6 +67,7 @@ Notes:
 """
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 from base import OXObjectPot, OXObject, OXception
 from data.OXData import OXData
@@ -97,19 +98,8 @@ class OXDatabase(OXObjectPot):
         :class:`base.OXObjectPot.OXObjectPot`
         :class:`data.OXData.OXData`
     """
-
-    def add_object(self, obj: OXObject):
-        """Add an OXData object to the database.
-
-        Args:
-            obj (OXObject): The object to add. Must be an instance of OXData.
-
-        Raises:
-            OXception: If the object is not an instance of OXData.
-        """
-        if not isinstance(obj, OXData):
-            raise OXception("Only OXData can be added to OXDatabase")
-        super().add_object(obj)
+    _accepted_type: ClassVar[type] = OXData
+    _reject_message: ClassVar[str] = "Only OXData can be added to OXDatabase"
 
     def remove_object(self, obj: OXObject):
         """Remove an OXData object from the database.
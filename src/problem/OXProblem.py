@@ -51,12 +51,11 @@ Module Dependencies:
 
 import dataclasses
 import itertools
-import operator
-from collections.abc import Callable
+import math
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import StrEnum
 from fractions import Fraction
-from functools import reduce
 from typing import Self
 from uuid import UUID
 
@@ -91,6 +90,93 @@ class SpecialConstraintType(StrEnum):
     ConditionalConstraint = "ConditionalConstraint"
 
 
+def _as_list(values: Iterable | None) -> list | None:
+    """Return ``values`` as a list, consuming other iterables exactly once.
+
+    Lists and None are returned unchanged, so callers that already pass lists
+    do not pay for a copy.
+    """
+    if values is None or isinstance(values, list):
+        return values
+    return list(values)
+
+
+def _parameter_error(has_search_function: bool, has_variables: bool,
+                     has_weight_function: bool, has_weights: bool) -> str | None:
+    """Return the validation error for one combination of constraint arguments.
+
+    The checks run in a fixed order, so each combination reports the first rule
+    it breaks.
+
+    Returns:
+        str | None: The error message, or None if the combination is valid.
+    """
+    if not has_search_function and not has_variables:
+        return "Either variable_search_function or variables must be provided."
+    if has_search_function and has_variables:
+        return "Only one of variable_search_function or variables can be provided."
+    if not has_weight_function and not has_weights:
+        return "Either weight_calculation_function or weights must be provided."
+    if has_weight_function and has_weights:
+        return "Only one of weight_calculation_function or weights can be provided."
+    if has_search_function and not has_weight_function:
+        return "weight_calculation_function must be provided if variable_search_function is provided."
+    if has_variables and not has_weights:
+        return "weights must be provided if variables is provided."
+    return None
+
+
+# Validation result for every combination of provided constraint arguments, keyed by
+# the bits (variable_search_function, variables, weight_calculation_function, weights).
+_PARAMETER_ERRORS = {mask: _parameter_error(*(bool(mask >> bit & 1) for bit in (3, 2, 1, 0)))
+                     for mask in range(16)}
+
+
+def _product_bounds(domains: list[tuple[float, float]]) -> tuple[float, float]:
+    """Return the bounds of a product of variables from their domains.
+
+    The domains are multiplied pairwise with interval arithmetic. The range of
+    ``x * y`` over a box is reached at one of its four corners, so each step
+    keeps only the smallest and largest corner product. This gives the same
+    bounds as enumerating every corner of the full domain in O(n) instead of
+    O(2**n) products.
+
+    Args:
+        domains (list[tuple[float, float]]): (lower_bound, upper_bound) pairs,
+            at least one.
+
+    Returns:
+        tuple[float, float]: The lower and upper bound of the product.
+    """
+    lower_bound, upper_bound = domains[0]
+    for lb, ub in domains[1:]:
+        corners = (lower_bound * lb, lower_bound * ub, upper_bound * lb, upper_bound * ub)
+        lower_bound, upper_bound = min(corners), max(corners)
+    return lower_bound, upper_bound
+
+
+def _summation_bounds(domains: list[tuple[float, float]]) -> tuple[float, float]:
+    """Return the bounds of a sum of variables from their domains.
+
+    Args:
+        domains (list[tuple[float, float]]): (lower_bound, upper_bound) pairs.
+
+    Returns:
+        tuple[float, float]: The sums of the lower and of the upper bounds.
+    """
+    return sum(lb for lb, _ in domains), sum(ub for _, ub in domains)
+
+
+def _division_bounds(lower_bound: float, upper_bound: float, divisor: int) -> tuple[float, float]:
+    """Return the bounds of a variable divided by ``divisor``."""
+    return lower_bound / divisor, upper_bound / divisor
+
+
+def _modulo_bounds(divisor: int) -> tuple[int, int]:
+    """Return the bounds of a variable taken modulo ``divisor``."""
+    return 0, divisor - 1
+
+
 def _create_multiplicative_equality_constraint(problem: 'OXCSPProblem',
                                                input_variables: Callable[[OXObject], bool] | list[OXObject] = None
                                                ) -> OXMultiplicativeEqualityConstraint:
@@ -100,14 +186,15 @@ def _create_multiplicative_equality_constraint(problem: 'OXCSPProblem',
     output_variable = input_variable_1 * input_variable_2 * ... * input_variable_n
 
     The function automatically calculates the bounds for the output variable
-    based on the Cartesian product of all input variable domains.
+    from the extreme products of the input variable domains.
 
     Args:
         problem (OXCSPProblem): The problem instance to add the constraint to.
         input_variables (Callable[[OXObject], bool] | list[OXObject], optional):
-            Either a function to search for variables or a list of variables
-            to multiply. If a function is provided, it will be used to filter
-            variables from the problem.
+            Either a function to search for variables, a list of variables
+            to multiply, or an OXVariableSet such as ``problem.variables``. If a
+            function is provided, it will be used to filter variables from the
+            problem. A variable set is read through its snapshot.
 
     Returns:
         OXMultiplicativeEqualityConstraint: The created constraint object.
@@ -132,6 +219,8 @@ def _create_multiplicative_equality_constraint(problem: 'OXCSPProblem',
     """
     if isinstance(input_variables, Callable):
         input_variables = [var for var in problem.variables if input_variables(var)]
+    elif isinstance(input_variables, OXVariableSet):
+        input_variables = input_variables.as_tuple()
     variable_uuids = [var.id for var in input_variables]
 
     if len(variable_uuids) < 2:
@@ -139,11 +228,7 @@ def _create_multiplicative_equality_constraint(problem: 'OXCSPProblem',
 
     domains = [(var.lower_bound, var.upper_bound) for var in input_variables]
 
-    combinations = itertools.product(*domains)
-
-    products = [reduce(operator.mul, combination) for combination in combinations]
-
-    lower_bound, upper_bound = min(products), max(products)
+    lower_bound, upper_bound = _product_bounds(domains)
 
     new_var_name = f"Multiplication of {'_'.join(var.name for var in input_variables)}"
 
@@ -217,29 +302,21 @@ def _create_division_or_modulus_equality_constraint(problem: 'OXCSPProblem',
     lower_bound, upper_bound = input_variable[0].lower_bound, input_variable[0].upper_bound
 
     if constraint_type == SpecialConstraintType.DivisionEquality:
-        lb, ub = lower_bound / divisor, upper_bound / divisor
+        constraint_class = OXDivisionEqualityConstraint
+        lb, ub = _division_bounds(lower_bound, upper_bound, divisor)
     else:
-        lb, ub = 0, divisor - 1
+        constraint_class = OXModuloEqualityConstraint
+        lb, ub = _modulo_bounds(divisor)
 
-    if constraint_type == SpecialConstraintType.DivisionEquality:
-        new_var_name = f"{input_variable[0].name} / {divisor}"
-    else:
-        new_var_name = f"{input_variable[0].name} % {divisor}"
+    new_var_name = f"{input_variable[0].name} {constraint_class.operator_symbol} {divisor}"
 
     problem.create_decision_variable(var_name=new_var_name, lower_bound=lb, upper_bound=ub)
 
-    if constraint_type == SpecialConstraintType.DivisionEquality:
-        result = OXDivisionEqualityConstraint(
-            input_variable=input_variable[0].id,
-            output_variable=problem.variables.last_object.id,
-            denominator=divisor
-        )
-    else:
-        result = OXModuloEqualityConstraint(
-            input_variable=input_variable[0].id,
-            output_variable=problem.variables.last_object.id,
-            denominator=divisor
-        )
+    result = constraint_class(
+        input_variable=input_variable[0].id,
+        output_variable=problem.variables.last_object.id,
+        denominator=divisor
+    )
 
     problem.specials.append(result)
 
@@ -260,7 +337,10 @@ def _create_summation_equality_constraint(problem: 'OXCSPProblem',
     Args:
         problem (OXCSPProblem): The problem instance to add the constraint to.
         input_variables (Callable[[OXObject], bool] | list[OXObject]): Either
-            a function to search for variables or a list of variables to sum.
+            a function to search for variables, a list or tuple of variables to
+            sum, or an OXVariableSet such as ``problem.variables``. A variable set
+            is read through its snapshot, so the new output variable is not
+            part of the input.
             If a function is provided, it will be used to filter variables
             from the problem.
 
@@ -269,7 +349,7 @@ def _create_summation_equality_constraint(problem: 'OXCSPProblem',
 
     Raises:
         OXception: If fewer than 2 variables are provided, or if input_variables
-            is not a list of OXVariable objects.
+            is not a list or tuple of OXVariable objects.
 
     Examples:
         >>> # Using a list of variables
@@ -290,15 +370,16 @@ def _create_summation_equality_constraint(problem: 'OXCSPProblem',
     """
     if isinstance(input_variables, Callable):
         input_variables = [var for var in problem.variables if input_variables(var)]
+    elif isinstance(input_variables, OXVariableSet):
+        input_variables = input_variables.as_tuple()
     variable_uuids = [var.id for var in input_variables]
     if len(variable_uuids) < 2:
         raise OXception("Summation equality constraint requires at least 2 variables")
-    if not isinstance(input_variables, list):
-        raise OXception("input_variables must be a list of OXVariable objects")
+    if not isinstance(input_variables, (list, tuple)):
+        raise OXception("input_variables must be a list or tuple of OXVariable objects")
     if not all(isinstance(var, OXVariable) for var in input_variables):
         raise OXception("All elements in input_variables must be OXVariable objects")
-    lower_bound = sum(var.lower_bound for var in input_variables)
-    upper_bound = sum(var.upper_bound for var in input_variables)
+    lower_bound, upper_bound = _summation_bounds([(var.lower_bound, var.upper_bound) for var in input_variables])
     new_var_name = f"Summation of {'_'.join(var.name for var in input_variables)}"
     problem.create_decision_variable(var_name=new_var_name, lower_bound=lower_bound, upper_bound=upper_bound)
     result = OXSummationEqualityConstraint(
@@ -433,6 +514,24 @@ class OXCSPProblem(OXObject):
     specials: list[OXSpecialConstraint] = field(default_factory=list)
     constraints_in_special_constraints: list[UUID] = field(default_factory=list)
 
+    def reset(self):
+        """Return the problem to its freshly constructed state.
+
+        Empties the database, the variables, the constraints and the special
+        constraints in place. The containers themselves, and the problem's id,
+        are kept, so a problem can be reused instead of being rebuilt.
+
+        Examples:
+            >>> problem.reset()
+            >>> len(problem.variables)
+            0
+        """
+        self.db.clear()
+        self.variables.clear()
+        self.constraints.clear()
+        self.specials.clear()
+        self.constraints_in_special_constraints.clear()
+
     def create_special_constraint(self, *,
                                   constraint_type: SpecialConstraintType = SpecialConstraintType.MultiplicativeEquality,
                                   **kwargs
@@ -549,25 +648,33 @@ class OXCSPProblem(OXObject):
         invalid_arguments = argument_set.difference(available_object_type_set)
         if len(invalid_arguments) > 0:
             raise OXception(f"Invalid db object type(s) detected : {invalid_arguments}")
-        object_type_names = []
-        object_instances = []
+        # Resolve the related data entry and the format parameters of every
+        # instance once, instead of once per combination it takes part in.
+        object_entries = []
         for object_type in argument_set:
-            object_type_names.append(object_type)
-            object_instances.append(self.db.search_by_function(
-                lambda x: x.class_name.lower().endswith(object_type.lower())))
-
-        for instances_tuple in itertools.product(*object_instances):
+            entries = []
+            for instance in self.db.search_by_function(
+                    lambda x: x.class_name.lower().endswith(object_type.lower())):
+                parameters = {f"{object_type}_{field.name}": getattr(instance, field.name)
+                              for field in dataclasses.fields(instance)}
+                entries.append((object_type, instance.id, parameters))
+            object_entries.append(entries)
+
+        new_ids = OXObject._batch_uuids(math.prod(len(entries) for entries in object_entries))
+        new_variables = []
+        for new_id, entries_tuple in zip(new_ids, itertools.product(*object_entries)):
             related_data = {}
             format_parameters = {}
-            for i in range(len(object_type_names)):
-                related_data[object_type_names[i]] = instances_tuple[i].id
-                for field in dataclasses.fields(instances_tuple[i]):
-                    format_parameters[f"{object_type_names[i]}_{field.name}"] = getattr(instances_tuple[i], field.name)
-            var_name = var_name_template.format(**format_parameters)
-            var_description = var_description_template.format(**format_parameters)
-            self.create_decision_variable(var_name=var_name, description=var_description,
-                                          upper_bound=upper_bound, lower_bound=lower_bound,
-                                          **related_data)
+            for object_type, instance_id, parameters in entries_tuple:
+                related_data[object_type] = instance_id
+                format_parameters.update(parameters)
+            d_var = OXVariable(id=new_id,
+                               name=var_name_template.format_map(format_parameters),
+                               description=var_description_template.format_map(format_parameters),
+                               upper_bound=upper_bound, lower_bound=lower_bound)
+            d_var.related_data.update(related_data)
+            new_variables.append(d_var)
+        self.variables.extend_objects(new_variables)
 
     def create_decision_variable(self, var_name: str = "", description: str = "",
                                  upper_bound: float | int = float("inf"),
@@ -615,13 +722,57 @@ class OXCSPProblem(OXObject):
             The variable is automatically added to the problem's variable set
             and can be accessed through the variables attribute.
         """
-        d_var = OXVariable(name=var_name, description=description, upper_bound=upper_bound, lower_bound=lower_bound)
+        self.variables.add_object(self._new_decision_variable(self.db.get_object_types(), var_name, description,
+                                                              upper_bound, lower_bound, **kwargs))
+
+    def create_decision_variables(self, specs: Iterable[dict]):
+        """Create several decision variables in one batch.
+
+        Each specification holds the keyword arguments of one
+        :meth:`create_decision_variable` call. The database object types are
+        looked up once for the whole batch, and all variables are added to the
+        variable set with a single :meth:`OXVariableSet.extend_objects` call.
+
+        Args:
+            specs (Iterable[dict]): Keyword argument mappings, one per variable, in
+                the order the variables should be created.
+
+        Raises:
+            OXception: If any specification has a keyword argument that doesn't
+                match a database object type. No variable is added in that case.
+
+        Examples:
+            >>> problem.create_decision_variables([
+            ...     dict(var_name="x", upper_bound=10),
+            ...     dict(var_name="y", upper_bound=20),
+            ... ])
+        """
         db_types = self.db.get_object_types()
+        self.variables.extend_objects([self._new_decision_variable(db_types, **spec) for spec in specs])
+
+    def _new_decision_variable(self, db_types: list[str], var_name: str = "", description: str = "",
+                               upper_bound: float | int = float("inf"),
+                               lower_bound: float | int = 0,
+                               **kwargs) -> OXVariable:
+        """Build a decision variable without adding it to the problem.
+
+        Args:
+            db_types (list[str]): The database object types accepted as keyword arguments.
+            var_name, description, upper_bound, lower_bound, **kwargs: As for
+                :meth:`create_decision_variable`.
+
+        Returns:
+            OXVariable: The new variable with its related data filled in.
+
+        Raises:
+            OXception: If any keyword argument key doesn't match a database object type.
+        """
+        d_var = OXVariable(name=var_name, description=description, upper_bound=upper_bound, lower_bound=lower_bound)
         for key, value in kwargs.items():
             if key not in db_types:
                 raise OXception(f"Invalid key {key} for decision variable.")
             d_var.related_data[key] = value
-        self.variables.add_object(d_var)
+        return d_var
 
     def create_constraint(self,
                           variable_search_function: Callable[[OXObject], bool] = None,
@@ -647,9 +798,11 @@ class OXCSPProblem(OXObject):
                 Function to calculate weights for each variable. If provided,
                 weights parameter must be None.
             variables (list[UUID], optional): List of variable IDs to include in
-                the constraint. If provided, variable_search_function must be None.
+                the constraint. Any iterable, such as a generator, is accepted and
+                consumed once. If provided, variable_search_function must be None.
             weights (list[float | int], optional): List of weights for each variable.
-                If provided, weight_calculation_function must be None.
+                Any iterable is accepted and consumed once. If provided,
+                weight_calculation_function must be None.
             operator (RelationalOperators, optional): Relational operator for the
                 constraint. Defaults to LESS_THAN_EQUAL.
             value (float | int, optional): Right-hand side value of the constraint.
@@ -681,10 +834,12 @@ class OXCSPProblem(OXObject):
             Exactly one of variable_search_function/variables and one of
             weight_calculation_function/weights must be provided.
         """
+        variables = _as_list(variables)
+        weights = _as_list(weights)
         self._check_parameters(variable_search_function, variables, weight_calculation_function, weights)
 
         if variables is None:
-            variables = [v.id for v in self.variables.search_by_function(variable_search_function)]
+            variables = [v.id for v in self.variables.search_by_function_iter(variable_search_function)]
 
         if weights is None:
             weights = [weight_calculation_function(var, self) for var in variables]
@@ -727,20 +882,14 @@ class OXCSPProblem(OXObject):
 
         Note:
             This method is used internally by create_constraint and related methods
-            to ensure parameter consistency.
+            to ensure parameter consistency. The presence of the four arguments is
+            packed into a 4-bit mask and looked up in a table precomputed from
+            ``_parameter_error``.
         """
-        if variable_search_function is None and variables is None:
-            raise OXception("Either variable_search_function or variables must be provided.")
-        if variable_search_function is not None and variables is not None:
-            raise OXception("Only one of variable_search_function or variables can be provided.")
-        if weight_calculation_function is None and weights is None:
-            raise OXception("Either weight_calculation_function or weights must be provided.")
-        if weight_calculation_function is not None and weights is not None:
-            raise OXception("Only one of weight_calculation_function or weights can be provided.")
-        if variable_search_function is not None and weight_calculation_function is None:
-            raise OXception("weight_calculation_function must be provided if variable_search_function is provided.")
-        if variables is not None and weights is None:
-            raise OXception("weights must be provided if variables is provided.")
+        error = _PARAMETER_ERRORS[(variable_search_function is not None) << 3 | (variables is not None) << 2 |
+                                  (weight_calculation_function is not None) << 1 | (weights is not None)]
+        if error is not None:
+            raise OXception(error)
         if variables is not None and len(variables) != len(weights):
             raise OXception("variables and weights must have the same length.")
 
@@ -794,6 +943,17 @@ class OXLPProblem(OXCSPProblem):
     objective_function: OXpression = field(default_factory=OXpression)
     objective_type: ObjectiveType = ObjectiveType.MINIMIZE
 
+    def reset(self):
+        """Return the problem to its freshly constructed state.
+
+        In addition to :meth:`OXCSPProblem.reset`, the objective function is
+        replaced with an empty expression and the objective type is set back
+        to minimization.
+        """
+        super().reset()
+        self.objective_function = OXpression()
+        self.objective_type = ObjectiveType.MINIMIZE
+
     def create_objective_function(self,
                                   variable_search_function: Callable[[OXObject], bool] = None,
                                   weight_calculation_function: Callable[[OXVariable, Self], float | int] = None,
@@ -816,9 +976,11 @@ class OXLPProblem(OXCSPProblem):
                 Function to calculate weights for each variable. If provided,
                 weights parameter must be None.
             variables (list[UUID], optional): List of variable IDs to include in
-                the objective function. If provided, variable_search_function must be None.
+                the objective function. Any iterable, such as a generator, is accepted and
+                consumed once. If provided, variable_search_function must be None.
             weights (list[float | int], optional): List of weights for each variable.
-                If provided, weight_calculation_function must be None.
+                Any iterable is accepted and consumed once. If provided,
+                weight_calculation_function must be None.
             objective_type (ObjectiveType, optional): Whether to minimize or maximize
                 the objective function. Defaults to MINIMIZE.
 
@@ -841,10 +1003,12 @@ class OXLPProblem(OXCSPProblem):
             This method sets both the objective_function and objective_type
             attributes of the problem.
         """
+        variables = _as_list(variables)
+        weights = _as_list(weights)
         self._check_parameters(variable_search_function, variables, weight_calculation_function, weights)
 
         if variable_search_function is not None:
-            variables = [v.id for v in self.variables.search_by_function(variable_search_function)]
+            variables = [v.id for v in self.variables.search_by_function_iter(variable_search_function)]
             weights = [weight_calculation_function(var, self) for var in variables]
 
         self.objective_function = OXpression(variables=variables, weights=weights)
@@ -891,6 +1055,14 @@ class OXGPProblem(OXLPProblem):
     """
     goal_constraints: OXConstraintSet = field(default_factory=OXConstraintSet)
 
+    def reset(self):
+        """Return the problem to its freshly constructed state.
+
+        In addition to :meth:`OXLPProblem.reset`, the goal constraints are removed.
+        """
+        super().reset()
+        self.goal_constraints.clear()
+
     def create_goal_constraint(self,
                                variable_search_function: Callable[[OXObject], bool] = None,
                                weight_calculation_function: Callable[[UUID, Self], float | int | Fraction] = None,
@@ -918,9 +1090,11 @@ class OXGPProblem(OXLPProblem):
                 Function to calculate weights for each variable. If provided,
                 weights parameter must be None.
             variables (list[UUID], optional): List of variable IDs to include in
-                the constraint. If provided, variable_search_function must be None.
+                the constraint. Any iterable, such as a generator, is accepted and
+                consumed once. If provided, variable_search_function must be None.
             weights (list[float | int], optional): List of weights for each variable.
-                If provided, weight_calculation_function must be None.
+                Any iterable is accepted and consumed once. If provided,
+                weight_calculation_function must be None.
             operator (RelationalOperators, optional): Relational operator for the
                 constraint. Defaults to LESS_THAN_EQUAL.
             value (float | int, optional): Target value for the goal constraint.
@@ -114,6 +114,7 @@ Security Considerations:
 """
 
 from .serializers import (
+    deserialize_from_json,
     deserialize_from_python_dict,
     serialize_to_python_dict,
 )
@@ -122,4 +123,5 @@ __all__ = [
     # Core serialization functions
     "serialize_to_python_dict",
     "deserialize_from_python_dict",
+    "deserialize_from_json",
 ]
\ No newline at end of file
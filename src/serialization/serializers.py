@@ -51,7 +51,9 @@ Use Cases:
     - **Backup and Recovery**: Create complete backups of optimization problem states
 
 Module Dependencies:
-    - dataclasses: For automatic object field extraction via asdict()
+    - copy: For deep-copying field values that are not known to be immutable
+    - functools: For the bounded per-type cache of value converters
+    - dataclasses: For automatic object field extraction
     - base: Core OptiX object system and exception handling
     - utilities.class_loaders: Dynamic class loading for deserialization
 
@@ -92,6 +94,9 @@ Performance Considerations:
     - Complex nested structures increase serialization/deserialization time
     - Consider using streaming or chunked serialization for very large models
     - Cache class loading results when deserializing many objects of the same type
+    - Field names are resolved together with the converter of each class, which is kept
+      in a bounded cache, and immutable leaf values (strings, numbers, UUIDs, fractions)
+      are shared rather than deep-copied
 
 Security Notes:
     - Dynamic class loading poses potential security risks in untrusted environments
@@ -100,11 +105,75 @@ Security Notes:
     - Be cautious with deserialization of data from external sources
 """
 
-from dataclasses import asdict
+import copy
+import json
+from collections.abc import Callable
+from dataclasses import fields
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
 
 from base import OXObject, OXception
 from utilities.class_loaders import load_class
 
+#: Leaf types that are returned as-is instead of being deep-copied. Matched on the exact
+#: type so that subclasses with their own copy semantics still go through copy.deepcopy.
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), UUID, Fraction})
+
+
+def _serialize_value(value):
+    """Recursively convert a value the same way as :func:`dataclasses.asdict`.
+
+    Dataclass instances become dictionaries, lists, tuples, named tuples and
+    dictionaries are rebuilt with their own type, and any other value is deep-copied.
+    Values of an immutable leaf type are returned without copying.
+
+    The conversion is dispatched on the exact type of the value through the
+    bounded cache of :func:`_select_serializer`, so each value costs one cache
+    lookup instead of a chain of type checks.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The converted value.
+    """
+    return _select_serializer(type(value))(value)
+
+
+@lru_cache(maxsize=256)
+def _select_serializer(value_type: type) -> Callable[[Any], Any]:
+    """Choose the conversion for values of one type.
+
+    The checks run in the order :func:`dataclasses.asdict` applies them. The
+    result is cached per type in a bounded LRU cache, so serializing values of
+    many short-lived types cannot grow it without limit.
+
+    Args:
+        value_type (type): The exact type of the values to convert.
+
+    Returns:
+        Callable[[Any], Any]: A function converting one value of that type.
+    """
+    if value_type in _IMMUTABLE_TYPES:
+        return _return_unchanged
+    if hasattr(value_type, "__dataclass_fields__"):
+        names = tuple(f.name for f in fields(value_type))
+        return lambda value: {name: _serialize_value(getattr(value, name)) for name in names}
+    if issubclass(value_type, tuple) and hasattr(value_type, "_fields"):
+        return lambda value: value_type(*[_serialize_value(v) for v in value])
+    if issubclass(value_type, (list, tuple)):
+        return lambda value: value_type(map(_serialize_value, value))
+    if issubclass(value_type, dict):
+        return lambda value: value_type((_serialize_value(k), _serialize_value(v)) for k, v in value.items())
+    return copy.deepcopy
+
+
+def _return_unchanged(value):
+    """Return an immutable leaf value as-is."""
+    return value
+
 
 def serialize_to_python_dict(target_obj: OXObject) -> dict:
     """
@@ -112,8 +181,8 @@ def serialize_to_python_dict(target_obj: OXObject) -> dict:
     
     This function performs a comprehensive serialization of OptiX objects by converting
     them to Python dictionaries that preserve all object state, relationships, and
-    metadata necessary for complete reconstruction. The serialization process leverages
-    the dataclasses.asdict() function to automatically extract all object fields while
+    metadata necessary for complete reconstruction. The serialization process follows
+    the semantics of dataclasses.asdict() to extract all object fields while
     maintaining proper handling of nested objects and collections.
     
     The function is designed to handle the full complexity of OptiX object hierarchies,
@@ -122,7 +191,7 @@ def serialize_to_python_dict(target_obj: OXObject) -> dict:
     properly preserved in the serialized format.
     
     Serialization Process:
-        1. Extracts all dataclass fields using dataclasses.asdict()
+        1. Extracts all dataclass fields, resolving field names with the cached converter of each class
         2. Preserves object identity through the UUID-based 'id' field
         3. Includes class information via the 'class_name' field
         4. Recursively serializes nested OXObject instances
@@ -150,7 +219,7 @@ def serialize_to_python_dict(target_obj: OXObject) -> dict:
         AttributeError: If the object lacks required 'class_name' or 'id' attributes.
     
     Note:
-        - The function uses dataclasses.asdict() which automatically handles recursion
+        - The output matches dataclasses.asdict(), except that immutable leaf values are shared
         - Circular references in object graphs are not supported and may cause infinite recursion
         - Large object hierarchies may consume significant memory during serialization
         - The resulting dictionary is JSON-serializable for most OptiX object types
@@ -204,10 +273,12 @@ def serialize_to_python_dict(target_obj: OXObject) -> dict:
     
     See Also:
         deserialize_from_python_dict: Reverse operation for object reconstruction
-        dataclasses.asdict: Core Python function for dataclass serialization
+        dataclasses.asdict: Python function whose output format this function follows
         base.OXObject: Base class for all serializable OptiX objects
     """
-    return asdict(target_obj)
+    if not hasattr(type(target_obj), "__dataclass_fields__"):
+        raise TypeError("serialize_to_python_dict() should be called on dataclass instances")
+    return _serialize_value(target_obj)
 
 
 def deserialize_from_python_dict(source_dict: dict) -> OXObject:
@@ -228,8 +299,9 @@ def deserialize_from_python_dict(source_dict: dict) -> OXObject:
     Deserialization Process:
         1. Validates presence of required metadata fields ('class_name' and 'id')
         2. Dynamically loads the target class using the class name
-        3. Creates a new instance of the class with default initialization
-        4. Restores object identity by setting the 'id' field
+        3. Creates a new instance of the class with the stored 'id', so no throwaway
+           UUID is generated; 'class_name' is filled in by the class itself
+        4. Keeps the remaining fields at their defaults until they are restored
         5. Recursively deserializes nested dictionaries (potential OXObject instances)
         6. Processes collections containing dictionaries (lists of OXObject instances)
         7. Sets all reconstructed attributes on the target object
@@ -353,14 +425,7 @@ def deserialize_from_python_dict(source_dict: dict) -> OXObject:
         base.OXObject: Base class providing object identity and serialization support
         base.OXception: Custom exception types for OptiX framework errors
     """
-    if "class_name" not in source_dict:
-        raise OXception("class_name not found in dictionary")
-    if "id" not in source_dict:
-        raise OXception("id not found in dictionary")
-    class_name = source_dict["class_name"]
-    clazz = load_class(class_name)
-    retval = clazz()
-    retval.id = source_dict["id"]
+    retval = _instantiate(source_dict)
     for key, value in source_dict.items():
         if key != "class_name" and key != "id":
             if isinstance(value, dict):
@@ -377,3 +442,84 @@ def deserialize_from_python_dict(source_dict: dict) -> OXObject:
                             pass
             setattr(retval, key, value)
     return retval
+
+
+def _instantiate(source_dict: dict) -> OXObject:
+    """Create an empty instance of the class named in a serialized object.
+
+    Args:
+        source_dict (dict): The serialized object.
+
+    Returns:
+        OXObject: A new instance carrying the stored id, with every other field
+            at its default.
+
+    Raises:
+        OXception: If 'class_name' or 'id' is missing, or the class cannot be loaded.
+    """
+    if "class_name" not in source_dict:
+        raise OXception("class_name not found in dictionary")
+    if "id" not in source_dict:
+        raise OXception("id not found in dictionary")
+    return load_class(source_dict["class_name"])(id=source_dict["id"])
+
+
+def _json_object_hook(source_dict: dict) -> OXObject | dict:
+    """Rebuild one decoded JSON object, whose nested objects are already rebuilt.
+
+    The hook runs for every JSON object in the document, so objects are rebuilt
+    at any depth. Objects without the reserved fields, or whose class cannot be
+    loaded, are returned as plain dictionaries.
+    """
+    if "class_name" not in source_dict or "id" not in source_dict:
+        return source_dict
+    try:
+        retval = _instantiate(source_dict)
+    except OXception:
+        return source_dict
+    for key, value in source_dict.items():
+        if key != "class_name" and key != "id":
+            setattr(retval, key, value)
+    return retval
+
+
+def deserialize_from_json(source: str | bytes) -> OXObject:
+    """
+    Reconstruct an OptiX object directly from a JSON document.
+
+    The document is decoded with :func:`json.loads` and every JSON object that
+    carries 'class_name' and 'id' is turned into an instance while it is decoded,
+    innermost objects first, so no intermediate tree of plain dictionaries is
+    built and walked again.
+
+    The result is not always the same as ``deserialize_from_python_dict(json.loads(source))``.
+    That function only rebuilds objects held directly in a field or directly in
+    a list field, while this one also rebuilds objects nested deeper, such as
+    those inside lists of lists or inside plain dictionaries.
+
+    Args:
+        source (str | bytes): A JSON document holding one serialized object, as
+            produced by ``json.dumps(serialize_to_python_dict(obj), default=str)``.
+
+    Returns:
+        OXObject: The reconstructed object.
+
+    Raises:
+        OXception: If the top-level JSON object lacks 'class_name' or 'id', or
+            its class cannot be loaded.
+
+    Examples:
+        >>> text = json.dumps(serialize_to_python_dict(pot), default=str)
+        >>> restored = deserialize_from_json(text)
+
+    See Also:
+        deserialize_from_python_dict: Reconstruction of an already decoded dictionary,
+            limited to objects held directly in fields and list fields.
+    """
+    retval = json.loads(source, object_hook=_json_object_hook)
+    if isinstance(retval, OXObject):
+        return retval
+    if not isinstance(retval, dict):
+        raise OXception("JSON document does not hold an object")
+    # Re-run the checks on the plain top-level dictionary to report why it was not rebuilt
+    return deserialize_from_python_dict(retval)
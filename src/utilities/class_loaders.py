@@ -30,9 +30,14 @@ Example:
         assert loaded_class == OXObject
 
 Module Dependencies:
+    - functools: For caching loaded classes by name
+    - sys: For finding already imported modules
     - base.OXception: Framework-specific exception handling
 """
 
+import functools
+import sys
+
 from base.OXception import OXception
 
 
@@ -70,6 +75,7 @@ def get_fully_qualified_name(cls: type) -> str:
     """
     return cls.__module__ + "." + cls.__name__
 
+@functools.lru_cache(maxsize=None)
 def load_class(fully_qualified_name: str) -> type:
     """
     Dynamically load a Python class from its fully qualified name.
@@ -77,6 +83,11 @@ def load_class(fully_qualified_name: str) -> type:
     This function loads a class by parsing the fully qualified name string,
     importing the module, and retrieving the class object from the module.
 
+    Loaded classes are cached by name, so deserializing many objects of the
+    same class imports and looks it up only once. Names that fail to load are
+    not cached and raise again on every call. Call ``load_class.cache_clear()``
+    after reloading a module to pick up the new class objects.
+
     Args:
         fully_qualified_name (str): The fully qualified name of the class to load
                                    in the format ``module.ClassName``.
@@ -108,7 +119,11 @@ def load_class(fully_qualified_name: str) -> type:
     """
     try:
         module_name, class_name = fully_qualified_name.rsplit(".", 1)
-        module = __import__(module_name, fromlist=[class_name])
+        # Modules that are already imported are taken straight from sys.modules,
+        # without going through the import machinery and its lock.
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = __import__(module_name, fromlist=[class_name])
         retval = getattr(module, class_name)
         if retval is None:
             raise OXception(f"Class {fully_qualified_name} not found")
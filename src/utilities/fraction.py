@@ -1,5 +1,6 @@
 import functools
 import math
+from collections.abc import Callable
 from decimal import Decimal
 from fractions import Fraction
 
@@ -16,7 +17,9 @@ def calculate_fraction(value: float | Decimal | int| DynamicFloat) -> Fraction:
     is (a+c)/(b+d), which provides an efficient way to find rational approximations.
 
     The function handles edge cases where the value is already an integer and uses
-    caching to improve performance for repeated calculations.
+    caching to improve performance for repeated calculations. Consecutive mediant
+    steps that move the same bound are taken together with a doubling search, so
+    values such as 1e-6 do not need a million iterations.
 
     Args:
         value (float | Decimal | int): The numeric value to convert to a fraction.
@@ -51,13 +54,66 @@ def calculate_fraction(value: float | Decimal | int| DynamicFloat) -> Fraction:
     if int(math.ceil(value)) == int(math.floor(value)):
         return Fraction(math.ceil(value), 1)
     value = float(value)
-    ub = Fraction(math.ceil(value), 1)
-    lb = Fraction(math.floor(value), 1)
-    mediant = Fraction(ub.numerator + lb.numerator, ub.denominator + lb.denominator)
-    while not math.isclose(mediant, value):
-        if mediant < value:
-            lb = mediant
+    # Exact ratio of the float, used to compare mediants without rounding
+    ratio = value.as_integer_ratio()
+    lb = (math.floor(value), 1)
+    ub = (math.ceil(value), 1)
+    while True:
+        numerator, denominator = lb[0] + ub[0], lb[1] + ub[1]
+        if _is_close(numerator, denominator, value):
+            return Fraction(numerator, denominator)
+        # The walk keeps moving the same bound towards the other one for a run of
+        # steps. Skip the run at once by finding the first mediant that is close
+        # to the value or lands on its other side.
+        moving_lb = _below_value(numerator, denominator, ratio)
+        base, step = (lb, ub) if moving_lb else (ub, lb)
+        steps = _first_stop(functools.partial(_mediant_stops, base=base, step=step, value=value,
+                                              ratio=ratio, moving_lb=moving_lb))
+        bound = (base[0] + (steps - 1) * step[0], base[1] + (steps - 1) * step[1])
+        if moving_lb:
+            lb = bound
         else:
-            ub = mediant
-        mediant = Fraction(ub.numerator + lb.numerator, ub.denominator + lb.denominator)
-    return mediant
+            ub = bound
+
+
+def _is_close(numerator: int, denominator: int, value: float) -> bool:
+    """Return True if ``numerator / denominator`` is close enough to ``value``."""
+    return math.isclose(numerator / denominator, value)
+
+
+def _below_value(numerator: int, denominator: int, ratio: tuple[int, int]) -> bool:
+    """Return True if ``numerator / denominator`` is below the exact ratio of the value.
+
+    The comparison is done on integers, so it does not suffer from float rounding.
+    """
+    return numerator * ratio[1] < ratio[0] * denominator
+
+
+def _mediant_stops(k: int, base: tuple[int, int], step: tuple[int, int], value: float,
+                   ratio: tuple[int, int], moving_lb: bool) -> bool:
+    """Return True if the ``k``-th mediant of a run ends the run.
+
+    The ``k``-th mediant is ``base + k * step``. It ends the run when it is close
+    to the value or lies on the other side of the value than the moving bound.
+    """
+    numerator, denominator = base[0] + k * step[0], base[1] + k * step[1]
+    return _is_close(numerator, denominator, value) or _below_value(numerator, denominator, ratio) != moving_lb
+
+
+def _first_stop(stop: Callable[[int], bool]) -> int:
+    """Return the smallest ``k > 1`` for which ``stop(k)`` holds.
+
+    ``stop`` must be false for ``k = 1`` and stay true once it becomes true. The
+    search doubles ``k`` until ``stop`` holds and then bisects, so a run of ``k``
+    mediant steps costs O(log k) evaluations.
+    """
+    lo, hi = 1, 2
+    while not stop(hi):
+        lo, hi = hi, hi * 2
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if stop(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi
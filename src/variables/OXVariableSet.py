@@ -67,7 +67,9 @@ Module Dependencies:
     - variables.OXVariable: For OXVariable type definitions and validation
 """
 
+from array import array
 from dataclasses import dataclass
+from typing import ClassVar
 
 from base import OXObjectPot, OXObject, OXception
 from variables.OXVariable import OXVariable
@@ -104,8 +106,11 @@ class OXVariableSet(OXObjectPot):
     Performance Characteristics:
         - Variable addition: O(1) average case with type validation overhead
         - Variable removal: O(n) linear search with type validation
+        - UUID lookup (``var_set[uuid]``, ``uuid in var_set``): O(1) through the id index kept by OXObjectPot
         - Relationship queries: O(n) linear scan with predicate evaluation
         - Iteration: O(n) with minimal memory overhead for large collections
+        - Column extraction (:meth:`lower_bounds`, :meth:`upper_bounds`, :meth:`values`):
+          one O(n) pass producing a contiguous ``array('d')`` buffer
 
     Thread Safety:
         - Read operations (iteration, querying, length) are thread-safe
@@ -177,71 +182,8 @@ class OXVariableSet(OXObjectPot):
         :class:`variables.OXVariable.OXVariable`: Variable type managed by this container.
         :class:`base.OXObject`: Base object type for UUID and serialization support.
     """
-
-    def add_object(self, obj: OXObject):
-        """
-        Add an OXVariable instance to the variable collection.
-        
-        This method performs type validation to ensure only OXVariable instances
-        are added to the set, maintaining type safety and collection integrity.
-        The validation occurs before delegation to the parent container's add
-        operation, preventing invalid state and ensuring optimization model consistency.
-        
-        The method enforces the container's type invariant that all contained
-        objects must be optimization variables, which is essential for the
-        specialized querying and management operations provided by this class.
-
-        Args:
-            obj (OXObject): The variable object to add to the collection. Must be
-                           an instance of OXVariable or its subclasses. The object
-                           will be stored and can be retrieved through iteration
-                           or relationship-based queries.
-
-        Raises:
-            OXception: If the provided object is not an instance of OXVariable.
-                      This strict type checking prevents runtime errors and
-                      maintains the mathematical integrity of variable collections.
-
-        Performance:
-            - Time complexity: O(1) average case for the type check and container addition
-            - Space complexity: O(1) additional memory for the new variable reference
-            - Type validation adds minimal overhead compared to container operations
-
-        Note:
-            - Duplicate variables (same UUID) will be handled by the parent container
-            - The variable's related_data can be modified after addition for querying
-            - Type validation is strict and does not allow duck-typing or coercion
-
-        Examples:
-            Add variables with proper type validation:
-            
-            .. code-block:: python
-            
-                var_set = OXVariableSet()
-                
-                # Valid addition - OXVariable instance
-                production_var = OXVariable(name="production", lower_bound=0)
-                var_set.add_object(production_var)  # Success
-                
-                # Valid addition - OXVariable subclass
-                deviation_var = OXDeviationVar(name="deviation")
-                var_set.add_object(deviation_var)  # Success
-                
-                # Invalid addition - wrong type
-                from base.OXObject import OXObject
-                generic_obj = OXObject()
-                try:
-                    var_set.add_object(generic_obj)  # Raises OXception
-                except OXception as e:
-                    print("Type validation prevented invalid addition")
-
-        See Also:
-            :meth:`remove_object`: Type-safe variable removal from the collection.
-            :meth:`query`: Relationship-based variable querying capabilities.
-        """
-        if not isinstance(obj, OXVariable):
-            raise OXception("Only OXVariable can be added to OXVariableSet")
-        super().add_object(obj)
+    _accepted_type: ClassVar[type] = OXVariable
+    _reject_message: ClassVar[str] = "Only OXVariable can be added to OXVariableSet"
 
     def remove_object(self, obj: OXObject):
         """
@@ -349,6 +291,9 @@ class OXVariableSet(OXObjectPot):
             - Time complexity: O(n × k) where n is variables count and k is query criteria count
             - Space complexity: O(m) where m is the number of matching variables
             - Linear scan through all variables makes this suitable for moderate-sized collections
+            - Empty queries return immediately without scanning
+            - No index is kept because related_data dictionaries may be edited after the
+              variable has been added
 
         Note:
             - Query parameters are case-sensitive and require exact key matches
@@ -407,18 +352,61 @@ class OXVariableSet(OXObjectPot):
             :meth:`search_by_function`: Lower-level search functionality from parent class.
         """
 
-        def query_function(obj: OXObject):
-            if isinstance(obj, OXVariable):
-                number_of_keys_found = 0
-                for key, value in kwargs.items():
-                    if key in obj.related_data:
-                        number_of_keys_found += 1
-                        if obj.related_data[key] != value:
-                            return False
-                if number_of_keys_found == 0:
-                    return False
-                return True
-            else:
+        if not kwargs:
+            return []
+        criteria = tuple(kwargs.items())
+        result = []
+        for obj in self.objects:
+            if not isinstance(obj, OXVariable):
                 raise OXception("This should not happen.")
+            related_data = obj.related_data
+            key_found = False
+            for key, value in criteria:
+                if key in related_data:
+                    if related_data[key] != value:
+                        break
+                    key_found = True
+            else:
+                if key_found:
+                    result.append(obj)
+        return result
 
-        return self.search_by_function(query_function)
+    def lower_bounds(self) -> array:
+        """Return the lower bounds of all variables as a contiguous column.
+
+        The column is ordered like the set itself, so row ``i`` belongs to
+        ``objects[i]``. Being an ``array('d')``, it exposes the buffer protocol
+        and can be wrapped without copying, e.g. ``numpy.frombuffer(var_set.lower_bounds())``.
+
+        Returns:
+            array: A snapshot of the variables' lower bounds taken at call time.
+
+        Examples:
+            >>> var_set.lower_bounds()
+            array('d', [0.0, 5.0])
+        """
+        return array("d", [var.lower_bound for var in self.objects])
+
+    def upper_bounds(self) -> array:
+        """Return the upper bounds of all variables as a contiguous column.
+
+        Returns:
+            array: A snapshot of the variables' upper bounds taken at call time,
+                ordered like the set. Unbounded variables yield ``inf``.
+
+        See Also:
+            :meth:`lower_bounds`: Column layout and ordering guarantees.
+        """
+        return array("d", [var.upper_bound for var in self.objects])
+
+    def values(self) -> array:
+        """Return the current values of all variables as a contiguous column.
+
+        Returns:
+            array: A snapshot of the variables' values taken at call time, ordered
+                like the set. Variables without a value yield ``nan``.
+
+        See Also:
+            :meth:`lower_bounds`: Column layout and ordering guarantees.
+        """
+        return array("d", [float("nan") if var.value is None else var.value for var in self.objects])
@@ -100,3 +100,28 @@ def test_OXData_serialize():
     obj1.active_scenario = "TestScenario2"
     assert obj1.ayakta == 30
     assert obj1.oturan == 30
+
+
+def test_OXData_scenario_switch_updates_existing_values():
+    obj = TestOtobusSinifi()
+    ayakta = obj.ayakta
+    obj.create_scenario("TestScenario", ayakta=20)
+    obj.active_scenario = "TestScenario"
+    assert ayakta == 20
+    assert obj.oturan == 10
+    obj.create_scenario("TestScenario", ayakta=25)
+    assert ayakta == 25
+    obj.active_scenario = "Missing"
+    assert ayakta == 10
+
+
+def test_OXData_sees_direct_scenario_edits():
+    obj = TestOtobusSinifi()
+    obj.create_scenario("TestScenario", ayakta=20)
+    obj.active_scenario = "TestScenario"
+    assert obj.ayakta == 20
+    obj.scenarios["TestScenario"] = {"ayakta": 40}
+    assert obj.ayakta == 40
+    obj.scenarios = {"TestScenario": {"oturan": 5}}
+    assert obj.ayakta == 10
+    assert obj.oturan == 5
@@ -49,6 +49,8 @@ Base Object Features Tested:
 from uuid import UUID
 
 from base.OXObject import OXObject
+from utilities.class_loaders import get_fully_qualified_name
+from variables.OXVariable import OXVariable
 
 
 def test_default_initialization():
@@ -109,4 +111,42 @@ def test_post_init_sets_class_name():
     # Reset class_name and call __post_init__ manually
     obj.class_name = ""
     obj.__post_init__()
-    assert obj.class_name == "base.OXObject.OXObject"
\ No newline at end of file
+    assert obj.class_name == "base.OXObject.OXObject"
+
+
+def test_subclass_class_name_is_shared():
+    """Test that subclasses get a per-class name shared by all their instances."""
+    var1 = OXVariable()
+    var2 = OXVariable()
+    assert var1.class_name == get_fully_qualified_name(OXVariable)
+    assert var1.class_name is var2.class_name
+
+
+def test_subclass_equality_and_hash_use_id():
+    """Test that dataclass subclasses compare and hash by class and id."""
+    custom_id = UUID("12345678-1234-5678-1234-567812345678")
+    var1 = OXVariable(id=custom_id, name="x")
+    var2 = OXVariable(id=custom_id, name="y")
+    assert var1 == var2
+    assert hash(var1) == hash(var2)
+    assert var1 in {var2}
+    assert var1 != OXObject(id=custom_id)
+
+
+def test_type_name_is_computed_per_class():
+    """Test that the short type name drops the OX prefix and is lowercased."""
+    class Vehicle(OXObject):
+        pass
+
+    assert OXObject._ox_type_name == "object"
+    assert OXVariable._ox_type_name == "variable"
+    assert Vehicle()._ox_type_name == "vehicle"
+
+
+def test_batch_uuids():
+    """Test that batch generated ids are distinct version 4 UUIDs."""
+    ids = OXObject._batch_uuids(50)
+    assert len(ids) == 50
+    assert len(set(ids)) == 50
+    assert all(isinstance(i, UUID) and i.version == 4 for i in ids)
+    assert OXObject._batch_uuids(0) == []
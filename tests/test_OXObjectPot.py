@@ -52,6 +52,7 @@ import pytest
 
 from src.base.OXObject import OXObject
 from src.base.OXObjectPot import OXObjectPot
+from base.OXception import OXception
 
 
 class TestObject(OXObject):
@@ -114,7 +115,7 @@ def test_iteration():
     pot.add_object(obj1)
     pot.add_object(obj2)
     
-    objects = list(pot)
+    objects = pot.as_tuple()
     assert len(objects) == 2
     assert obj1 in objects
     assert obj2 in objects
@@ -211,4 +212,202 @@ def test_get_object_types():
     types = pot.get_object_types()
     assert len(types) == 2
     assert "testobject" in types
-    assert "object" in types
\ No newline at end of file
+    assert "object" in types
+
+
+def test_get_object_types_follows_container_changes():
+    """Test that object types are updated on removal and for pots built with objects."""
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = OXObject()
+    pot = OXObjectPot(objects=[obj1, obj2])
+    assert sorted(pot.get_object_types()) == ["object", "testobject"]
+    assert pot[obj2.id] is obj2
+
+    pot.remove_object(obj2)
+    assert pot.get_object_types() == ["testobject"]
+
+    pot.add_object(OXObject())
+    assert sorted(pot.get_object_types()) == ["object", "testobject"]
+
+
+def test_get_object_types_follows_in_place_list_edits():
+    """Test that object types are recounted after edits made directly on the objects list."""
+    pot = OXObjectPot()
+    pot.add_object(TestObject(name="obj1", value=1))
+    pot.add_object(OXObject())
+    assert pot.get_object_types() == ["testobject", "object"]
+
+    pot.objects[1] = TestObject(name="obj2", value=2)
+    assert pot.get_object_types() == ["testobject"]
+
+    pot.objects = [OXObject()]
+    assert pot.get_object_types() == ["object"]
+    pot.objects.append(TestObject(name="obj3", value=3))
+    assert pot.get_object_types() == ["object", "testobject"]
+
+
+def test_uuid_lookup_follows_container_changes():
+    """Test that UUID lookups stay correct after removal and list replacement."""
+    pot = OXObjectPot()
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = TestObject(name="obj2", value=2)
+    pot.add_object(obj1)
+    pot.add_object(obj2)
+    assert pot[obj2.id] is obj2
+    assert obj1.id in pot
+
+    pot.remove_object(obj1)
+    assert obj1.id not in pot
+    with pytest.raises(OXception):
+        _ = pot[obj1.id]
+
+    pot.objects = [obj1]
+    assert pot[obj1.id] is obj1
+    assert obj2 not in pot
+
+
+def test_uuid_lookup_follows_in_place_list_edits():
+    """Test that UUID lookups see edits made directly on the objects list."""
+    pot = OXObjectPot()
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = TestObject(name="obj2", value=2)
+    obj3 = TestObject(name="obj3", value=3)
+    pot.add_object(obj1)
+    pot.add_object(obj2)
+    assert obj2 in pot
+
+    pot.objects[1] = obj3
+    assert obj2 not in pot
+    assert pot[obj3.id] is obj3
+    with pytest.raises(OXception):
+        _ = pot[obj2.id]
+
+    pot.objects.append(obj2)
+    assert pot[obj2.id] is obj2
+    del pot.objects[0]
+    assert obj1.id not in pot
+
+
+def test_uuid_lookup_with_plain_objects_list():
+    """Test that a plain list passed to the constructor is scanned and stays aliased."""
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = TestObject(name="obj2", value=2)
+    objects = [obj1]
+    pot = OXObjectPot(objects=objects)
+    assert pot[obj1.id] is obj1
+
+    objects[0] = obj2
+    assert obj1 not in pot
+    assert pot[obj2.id] is obj2
+
+
+def test_search_uses_current_attribute_values():
+    """Test that search sees attribute changes made after an object was added."""
+    pot = OXObjectPot()
+    obj = TestObject(name="obj1", value=1)
+    pot.add_object(obj)
+
+    obj.value = 5
+    assert pot.search(value=1) == []
+    assert pot.search(value=5) == [obj]
+    assert pot.search(missing=None) == []
+
+
+def test_search_by_function_iter():
+    """Test that the lazy predicate search yields the same objects as the eager one."""
+    pot = OXObjectPot()
+    for i in range(4):
+        pot.add_object(TestObject(name=f"obj{i}", value=i))
+
+    matches = pot.search_by_function_iter(lambda obj: obj.value % 2 == 1)
+    assert not isinstance(matches, list)
+    assert list(matches) == pot.search_by_function(lambda obj: obj.value % 2 == 1)
+
+
+def test_search_with_non_identifier_attribute():
+    """Test that search also matches attributes that are not valid identifiers."""
+    pot = OXObjectPot()
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = TestObject(name="obj2", value=1)
+    setattr(obj1, "long-name", "x")
+    pot.add_object(obj1)
+    pot.add_object(obj2)
+
+    assert pot.search(**{"long-name": "x", "value": 1}) == [obj1]
+    assert pot.search() == [obj1, obj2]
+
+
+def test_as_tuple_snapshot():
+    """Test that the tuple snapshot is reused until the pot changes."""
+    pot = OXObjectPot()
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = TestObject(name="obj2", value=2)
+    pot.add_object(obj1)
+
+    snapshot = pot.as_tuple()
+    assert snapshot == (obj1,)
+    assert pot.as_tuple() is snapshot
+
+    pot.add_object(obj2)
+    assert pot.as_tuple() == (obj1, obj2)
+
+    pot.remove_object(obj1)
+    pot.add_object(obj1)
+    assert pot.as_tuple() == (obj2, obj1)
+
+    pot.clear()
+    assert pot.as_tuple() == ()
+
+
+def test_as_tuple_follows_in_place_list_edits():
+    """Test that the tuple snapshot is rebuilt after edits made directly on the objects list."""
+    pot = OXObjectPot()
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = TestObject(name="obj2", value=2)
+    pot.add_object(obj1)
+    assert pot.as_tuple() == (obj1,)
+
+    pot.objects[0] = obj2
+    assert pot.as_tuple() == (obj2,)
+
+    pot.objects.insert(0, obj1)
+    pot.objects.reverse()
+    assert pot.as_tuple() == (obj2, obj1)
+
+
+def test_ids_cached_with_snapshot():
+    """Test that the id tuple follows the objects and is reused until the pot changes."""
+    pot = OXObjectPot()
+    obj1 = TestObject(name="obj1", value=1)
+    obj2 = TestObject(name="obj2", value=2)
+    pot.add_object(obj1)
+
+    ids = pot.ids()
+    assert ids == (obj1.id,)
+    assert pot.ids() is ids
+
+    pot.add_object(obj2)
+    assert pot.ids() == (obj1.id, obj2.id)
+
+    pot.objects[0] = obj2
+    assert pot.ids() == (obj2.id, obj2.id)
+
+    pot.objects = [obj2]
+    assert pot.ids() == (obj2.id,)
+    pot.objects[0] = obj1
+    assert pot.ids() == (obj1.id,)
+
+
+def test_accepted_type_checked_on_add_and_extend():
+    """Test that a narrowed accepted type is enforced by both add paths."""
+    class TestObjectPot(OXObjectPot):
+        _accepted_type = TestObject
+        _reject_message = "Only TestObject can be added to TestObjectPot"
+
+    pot = TestObjectPot()
+    pot.add_object(TestObject(name="obj1", value=1))
+    with pytest.raises(OXception, match="Only TestObject can be added to TestObjectPot"):
+        pot.add_object(OXObject())
+    with pytest.raises(OXception, match="Only TestObject can be added to TestObjectPot"):
+        pot.extend_objects([TestObject(name="obj2", value=2), OXObject()])
+    assert len(pot) == 1
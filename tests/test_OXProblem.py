@@ -45,6 +45,10 @@ Test Coverage:
     - Database integration and variable/constraint storage
 """
 
+import copy
+import itertools
+import math
+from dataclasses import dataclass
 from uuid import UUID
 
 import pytest
@@ -58,16 +62,84 @@ from constraints.OXSpecialConstraints import (
     OXSummationEqualityConstraint
 )
 from constraints.OXpression import OXpression
+from data.OXData import OXData
 from data.OXDatabase import OXDatabase
 from problem.OXProblem import (
     OXCSPProblem, OXLPProblem, OXGPProblem,
-    SpecialConstraintType, ObjectiveType
+    SpecialConstraintType, ObjectiveType, _product_bounds
 )
 
 
-def test_oxcspproblem_initialization():
-    """Test default initialization of OXCSPProblem."""
+class _ProblemPool:
+    """A pool of problem instances that are reset and reused between tests."""
+
+    def __init__(self):
+        self._free = {}
+
+    def acquire(self, cls):
+        """Return a released instance of ``cls`` or a new one if none is free."""
+        free = self._free.get(cls)
+        return free.pop() if free else cls()
+
+    def release(self, problem):
+        """Reset ``problem`` and make it available to later tests."""
+        problem.reset()
+        self._free.setdefault(type(problem), []).append(problem)
+
+
+_pool = _ProblemPool()
+
+
+def _pooled_problem(request, cls):
+    problem = _pool.acquire(cls)
+    request.addfinalizer(lambda: _pool.release(problem))
+    return problem
+
+
+@pytest.fixture
+def csp_problem(request):
+    """Provide an empty OXCSPProblem from the problem pool."""
+    return _pooled_problem(request, OXCSPProblem)
+
+
+@pytest.fixture
+def lp_problem(request):
+    """Provide an empty OXLPProblem from the problem pool."""
+    return _pooled_problem(request, OXLPProblem)
+
+
+@pytest.fixture
+def gp_problem(request):
+    """Provide an empty OXGPProblem from the problem pool."""
+    return _pooled_problem(request, OXGPProblem)
+
+
+@pytest.fixture(params=[OXCSPProblem, OXLPProblem, OXGPProblem], ids=lambda cls: cls.__name__)
+def any_problem(request):
+    """Provide an empty problem of each problem class from the problem pool."""
+    return _pooled_problem(request, request.param)
+
+
+@pytest.fixture(scope="module")
+def _two_var_csp_template():
+    """Build a CSP problem with two bounded decision variables once per module."""
     problem = OXCSPProblem()
+    problem.create_decision_variables([
+        dict(var_name="var1", upper_bound=10),
+        dict(var_name="var2", upper_bound=20),
+    ])
+    return problem
+
+
+@pytest.fixture
+def two_var_csp(_two_var_csp_template):
+    """Provide each test with its own copy of the two variable CSP problem."""
+    return copy.deepcopy(_two_var_csp_template)
+
+
+def test_oxcspproblem_initialization(csp_problem):
+    """Test default initialization of OXCSPProblem."""
+    problem = csp_problem
 
     # Check default values
     assert isinstance(problem.db, OXDatabase)
@@ -76,9 +148,9 @@ def test_oxcspproblem_initialization():
     assert len(problem.specials) == 0
 
 
-def test_create_decision_variable():
-    """Test creating a decision variable in OXCSPProblem."""
-    problem = OXCSPProblem()
+def test_create_decision_variable(any_problem):
+    """Test creating a decision variable in every problem class."""
+    problem = any_problem
 
     # Create a decision variable
     problem.create_decision_variable(
@@ -97,16 +169,70 @@ def test_create_decision_variable():
     assert var.lower_bound == 0
 
 
-def test_create_constraint():
-    """Test creating a constraint in OXCSPProblem."""
-    problem = OXCSPProblem()
+@dataclass
+class Bus(OXData):
+    capacity: int = 0
+
+
+@dataclass
+class Route(OXData):
+    length: int = 0
 
-    # Create variables
-    problem.create_decision_variable(var_name="var1", upper_bound=10)
-    problem.create_decision_variable(var_name="var2", upper_bound=20)
+
+def test_create_variables_from_db(csp_problem):
+    """Test creating one variable per combination of database objects."""
+    problem = csp_problem
+    buses = [Bus(capacity=c) for c in (40, 50)]
+    routes = [Route(length=l) for l in (5, 10, 15)]
+    for obj in buses + routes:
+        problem.db.add_object(obj)
+
+    problem.create_variables_from_db(
+        Bus, Route,
+        var_name_template="bus_{bus_capacity}_route_{route_length}",
+        var_description_template="Bus {bus_id} on route {route_id}",
+        upper_bound=1
+    )
+
+    assert len(problem.variables) == 6
+    names = {var.name for var in problem.variables}
+    assert names == {f"bus_{b.capacity}_route_{r.length}" for b in buses for r in routes}
+    var = problem.variables.search(name="bus_50_route_10")[0]
+    assert var.related_data == {"bus": buses[1].id, "route": routes[1].id}
+    assert var.description == f"Bus {buses[1].id} on route {routes[1].id}"
+    assert var.upper_bound == 1
+    assert var.lower_bound == 0
+    assert problem.variables[var.id] is var
+
+
+def test_create_variables_from_db_with_invalid_arguments(csp_problem):
+    """Test that object types missing from the database are rejected."""
+    problem = csp_problem
+    problem.db.add_object(Bus(capacity=40))
+
+    with pytest.raises(OXception):
+        problem.create_variables_from_db(Bus, Route, var_name_template="x")
+    assert len(problem.variables) == 0
+
+
+def test_create_decision_variables_rejects_invalid_batch(csp_problem):
+    """Test that a batch with an invalid related data key adds no variables."""
+    problem = csp_problem
+
+    with pytest.raises(OXception, match="Invalid key bus for decision variable"):
+        problem.create_decision_variables([
+            dict(var_name="var1", upper_bound=10),
+            dict(var_name="var2", bus=UUID("12345678-1234-5678-1234-567812345678")),
+        ])
+    assert len(problem.variables) == 0
+
+
+def test_create_constraint(two_var_csp):
+    """Test creating a constraint in OXCSPProblem."""
+    problem = two_var_csp
 
     # Get variable IDs
-    var_ids = [var.id for var in problem.variables]
+    var_ids = list(problem.variables.ids())
 
     # Create a constraint
     problem.create_constraint(
@@ -126,13 +252,30 @@ def test_create_constraint():
     assert constraint.rhs == 30
 
 
-def test_create_constraint_with_search_function():
-    """Test creating a constraint using search and weight calculation functions."""
-    problem = OXCSPProblem()
+def test_create_constraint_with_iterables(two_var_csp):
+    """Test that variables and weights may be given as one-shot iterables."""
+    problem = two_var_csp
+    var_ids = list(problem.variables.ids())
 
-    # Create variables
-    problem.create_decision_variable(var_name="var1", upper_bound=10)
-    problem.create_decision_variable(var_name="var2", upper_bound=20)
+    problem.create_constraint(
+        variables=(var.id for var in problem.variables),
+        weights=iter([1, 2]),
+        operator=RelationalOperators.LESS_THAN_EQUAL,
+        value=30
+    )
+
+    constraint = problem.constraints.last_object
+    assert constraint.expression.variables == var_ids
+    assert constraint.expression.weights == [1, 2]
+    assert constraint.name == "1*var1 + 2*var2"
+
+    with pytest.raises(OXception):
+        problem.create_constraint(variables=iter(var_ids), weights=(w for w in [1]), value=10)
+
+
+def test_create_constraint_with_search_function(two_var_csp):
+    """Test creating a constraint using search and weight calculation functions."""
+    problem = two_var_csp
 
     # Define search and weight calculation functions
     def search_func(var):
@@ -159,109 +302,75 @@ def test_create_constraint_with_search_function():
     assert constraint.rhs == 30
 
 
-def test_create_multiplicative_equality_constraint():
-    """Test creating a multiplicative equality constraint."""
-    problem = OXCSPProblem()
+@pytest.mark.parametrize("constraint_type, variable_bounds, make_kwargs, expected_class, expected_bounds", [
+    # 2*3=6 to 4*5=20
+    (SpecialConstraintType.MultiplicativeEquality, [(2, 4), (3, 5)],
+     lambda variables: {"input_variables": variables},
+     OXMultiplicativeEqualityConstraint, (6, 20)),
+    # 10/5=2 to 20/5=4
+    (SpecialConstraintType.DivisionEquality, [(10, 20)],
+     lambda variables: {"input_variable": [variables.last_object], "divisor": 5},
+     OXDivisionEqualityConstraint, (2, 4)),
+    # 0 to divisor-1
+    (SpecialConstraintType.ModulusEquality, [(10, 20)],
+     lambda variables: {"input_variable": [variables.last_object], "divisor": 5},
+     OXModuloEqualityConstraint, (0, 4)),
+    # 2+3=5 to 4+5=9
+    (SpecialConstraintType.SummationEquality, [(2, 4), (3, 5)],
+     lambda variables: {"input_variables": variables},
+     OXSummationEqualityConstraint, (5, 9)),
+])
+def test_create_special_constraint(csp_problem, constraint_type, variable_bounds, make_kwargs,
+                                   expected_class, expected_bounds):
+    """Test creating special constraints and the bounds of their output variable."""
+    problem = csp_problem
 
     # Create variables
-    problem.create_decision_variable(var_name="var1", lower_bound=2, upper_bound=4)
-    problem.create_decision_variable(var_name="var2", lower_bound=3, upper_bound=5)
+    for i, (lower_bound, upper_bound) in enumerate(variable_bounds, start=1):
+        problem.create_decision_variable(var_name=f"var{i}", lower_bound=lower_bound, upper_bound=upper_bound)
 
-    # Create a multiplicative equality constraint
+    # Create the special constraint
     constraint = problem.create_special_constraint(
-        constraint_type=SpecialConstraintType.MultiplicativeEquality,
-        input_variables=list(problem.variables)
+        constraint_type=constraint_type,
+        **make_kwargs(problem.variables)
     )
 
     # Check that the constraint was created correctly
-    assert isinstance(constraint, OXMultiplicativeEqualityConstraint)
+    assert isinstance(constraint, expected_class)
     assert len(problem.specials) == 1
-    assert len(problem.variables) == 3  # Original 2 variables + 1 new variable
+    assert len(problem.variables) == len(variable_bounds) + 1  # Input variables + 1 new variable
 
-    # Check the new variable's bounds (2*3=6 to 4*5=20)
+    # Check the new variable's bounds
     new_var = problem.variables.last_object
-    assert new_var.lower_bound == 6
-    assert new_var.upper_bound == 20
+    assert (new_var.lower_bound, new_var.upper_bound) == expected_bounds
 
 
-def test_create_division_equality_constraint():
-    """Test creating a division equality constraint."""
-    problem = OXCSPProblem()
+@pytest.mark.parametrize("constraint_type, expected_name", [
+    (SpecialConstraintType.DivisionEquality, "var1 / 5"),
+    (SpecialConstraintType.ModulusEquality, "var1 % 5"),
+])
+def test_division_and_modulo_output_variable_name(csp_problem, constraint_type, expected_name):
+    """Test that the output variable of division and modulo constraints is named after the operation."""
+    csp_problem.create_decision_variable(var_name="var1", lower_bound=10, upper_bound=20)
+    csp_problem.create_special_constraint(constraint_type=constraint_type,
+                                          input_variable=[csp_problem.variables.last_object], divisor=5)
+    assert csp_problem.variables.last_object.name == expected_name
 
-    # Create a variable
-    problem.create_decision_variable(var_name="var1", lower_bound=10, upper_bound=20)
 
-    # Create a division equality constraint
-    constraint = problem.create_special_constraint(
-        constraint_type=SpecialConstraintType.DivisionEquality,
-        input_variable=[problem.variables.last_object],
-        divisor=5
-    )
+@pytest.mark.parametrize("domains", [
+    [(2, 4), (3, 5)],
+    [(-2, 3), (-5, 1), (4, 6)],
+    [(-3, -1), (-2, -1), (-4, 2), (0, 5)],
+])
+def test_product_bounds_match_corner_products(domains):
+    """Test that the product bounds equal the extreme products over all domain corners."""
+    products = [math.prod(corner) for corner in itertools.product(*domains)]
+    assert _product_bounds(domains) == (min(products), max(products))
 
-    # Check that the constraint was created correctly
-    assert isinstance(constraint, OXDivisionEqualityConstraint)
-    assert len(problem.specials) == 1
-    assert len(problem.variables) == 2  # Original variable + 1 new variable
-
-    # Check the new variable's bounds (10/5=2 to 20/5=4)
-    new_var = problem.variables.last_object
-    assert new_var.lower_bound == 2
-    assert new_var.upper_bound == 4
-
-
-def test_create_modulus_equality_constraint():
-    """Test creating a modulus equality constraint."""
-    problem = OXCSPProblem()
-
-    # Create a variable
-    problem.create_decision_variable(var_name="var1", lower_bound=10, upper_bound=20)
-
-    # Create a modulus equality constraint
-    constraint = problem.create_special_constraint(
-        constraint_type=SpecialConstraintType.ModulusEquality,
-        input_variable=[problem.variables.last_object],
-        divisor=5
-    )
-
-    # Check that the constraint was created correctly
-    assert isinstance(constraint, OXModuloEqualityConstraint)
-    assert len(problem.specials) == 1
-    assert len(problem.variables) == 2  # Original variable + 1 new variable
-
-    # Check the new variable's bounds (0 to divisor-1)
-    new_var = problem.variables.last_object
-    assert new_var.lower_bound == 0
-    assert new_var.upper_bound == 4
-
-
-def test_create_summation_equality_constraint():
-    """Test creating a summation equality constraint."""
-    problem = OXCSPProblem()
-
-    # Create variables
-    problem.create_decision_variable(var_name="var1", lower_bound=2, upper_bound=4)
-    problem.create_decision_variable(var_name="var2", lower_bound=3, upper_bound=5)
 
-    # Create a summation equality constraint
-    constraint = problem.create_special_constraint(
-        constraint_type=SpecialConstraintType.SummationEquality,
-        input_variables=list(problem.variables)
-    )
-
-    # Check that the constraint was created correctly
-    assert isinstance(constraint, OXSummationEqualityConstraint)
-    assert len(problem.specials) == 1
-    assert len(problem.variables) == 3  # Original 2 variables + 1 new variable
-
-    # Check the new variable's bounds (2+3=5 to 4+5=9)
-    new_var = problem.variables.last_object
-    assert new_var.lower_bound == 5
-    assert new_var.upper_bound == 9
-
-
-def test_oxlpproblem_initialization():
+def test_oxlpproblem_initialization(lp_problem):
     """Test default initialization of OXLPProblem."""
-    problem = OXLPProblem()
+    problem = lp_problem
 
     # Check default values
     assert isinstance(problem.db, OXDatabase)
@@ -272,16 +381,18 @@ def test_oxlpproblem_initialization():
     assert problem.objective_type == ObjectiveType.MINIMIZE
 
 
-def test_create_objective_function():
+def test_create_objective_function(lp_problem):
     """Test creating an objective function in OXLPProblem."""
-    problem = OXLPProblem()
+    problem = lp_problem
 
     # Create variables
-    problem.create_decision_variable(var_name="var1", upper_bound=10)
-    problem.create_decision_variable(var_name="var2", upper_bound=20)
+    problem.create_decision_variables([
+        dict(var_name="var1", upper_bound=10),
+        dict(var_name="var2", upper_bound=20),
+    ])
 
     # Get variable IDs
-    var_ids = [var.id for var in problem.variables]
+    var_ids = list(problem.variables.ids())
 
     # Create an objective function
     problem.create_objective_function(
@@ -296,9 +407,9 @@ def test_create_objective_function():
     assert problem.objective_type == ObjectiveType.MAXIMIZE
 
 
-def test_oxgpproblem_initialization():
+def test_oxgpproblem_initialization(gp_problem):
     """Test default initialization of OXGPProblem."""
-    problem = OXGPProblem()
+    problem = gp_problem
 
     # Check default values
     assert isinstance(problem.db, OXDatabase)
@@ -310,16 +421,18 @@ def test_oxgpproblem_initialization():
     assert len(problem.goal_constraints) == 0
 
 
-def test_create_goal_constraint():
+def test_create_goal_constraint(gp_problem):
     """Test creating a goal constraint in OXGPProblem."""
-    problem = OXGPProblem()
+    problem = gp_problem
 
     # Create variables
-    problem.create_decision_variable(var_name="var1", upper_bound=10)
-    problem.create_decision_variable(var_name="var2", upper_bound=20)
+    problem.create_decision_variables([
+        dict(var_name="var1", upper_bound=10),
+        dict(var_name="var2", upper_bound=20),
+    ])
 
     # Get variable IDs
-    var_ids = [var.id for var in problem.variables]
+    var_ids = list(problem.variables.ids())
 
     # Create a goal constraint
     problem.create_goal_constraint(
@@ -340,16 +453,18 @@ def test_create_goal_constraint():
     assert goal.rhs == 30
 
 
-def test_oxgpproblem_create_objective_function():
+def test_oxgpproblem_create_objective_function(gp_problem):
     """Test creating an objective function in OXGPProblem."""
-    problem = OXGPProblem()
+    problem = gp_problem
 
     # Create variables
-    problem.create_decision_variable(var_name="var1", upper_bound=10)
-    problem.create_decision_variable(var_name="var2", upper_bound=20)
+    problem.create_decision_variables([
+        dict(var_name="var1", upper_bound=10),
+        dict(var_name="var2", upper_bound=20),
+    ])
 
     # Create goal constraints
-    var_ids = [var.id for var in problem.variables]
+    var_ids = list(problem.variables.ids())
     problem.create_goal_constraint(
         variables=var_ids,
         weights=[1, 2],
@@ -363,55 +478,77 @@ def test_oxgpproblem_create_objective_function():
     # Check that the objective function was created correctly
     # It should include the undesired deviation variables from the goal constraints
     assert len(problem.objective_function.variables) > 0
-    assert all(weight == 1.0 for weight in problem.objective_function.weights)
+    weights = problem.objective_function.weights
+    assert weights == [1.0] * len(weights)
     assert problem.objective_type == ObjectiveType.MINIMIZE
 
 
-def test_parameter_validation():
+INVALID_CONSTRAINT_CALLS = [
+    # (case id, keyword arguments built from a variable id, expected message)
+    ("missing_variables",
+     lambda var_id: dict(value=10),
+     "Either variable_search_function or variables must be provided"),
+    ("both_search_function_and_variables",
+     lambda var_id: dict(variable_search_function=lambda x: True, variables=[var_id], weights=[1], value=10),
+     "Only one of variable_search_function or variables can be provided"),
+    ("missing_weights",
+     lambda var_id: dict(variables=[var_id], value=10),
+     "Either weight_calculation_function or weights must be provided"),
+    ("both_weight_function_and_weights",
+     lambda var_id: dict(variables=[var_id], weight_calculation_function=lambda x, y: 1, weights=[1], value=10),
+     "Only one of weight_calculation_function or weights can be provided"),
+    ("search_function_without_weight_function",
+     lambda var_id: dict(variable_search_function=lambda x: True, value=10),
+     "Either weight_calculation_function or weights must be provided"),
+    ("mismatched_lengths",
+     lambda var_id: dict(variables=[var_id], weights=[1, 2], value=10),
+     "variables and weights must have the same length"),
+]
+
+
+@pytest.mark.parametrize("make_kwargs, message", [case[1:] for case in INVALID_CONSTRAINT_CALLS],
+                         ids=[case[0] for case in INVALID_CONSTRAINT_CALLS])
+def test_parameter_validation(two_var_csp, make_kwargs, message):
     """Test parameter validation in create_constraint method."""
-    problem = OXCSPProblem()
-
-    # Create a variable
-    problem.create_decision_variable(var_name="var1")
+    problem = two_var_csp
     var_id = problem.variables.last_object.id
 
-    # Test missing both variable_search_function and variables
-    with pytest.raises(OXception):
-        problem.create_constraint(value=10)
+    with pytest.raises(OXception, match=message):
+        problem.create_constraint(**make_kwargs(var_id))
+    assert len(problem.constraints) == 0
 
-    # Test providing both variable_search_function and variables
-    with pytest.raises(OXception):
-        problem.create_constraint(
-            variable_search_function=lambda x: True,
-            variables=[var_id],
-            weights=[1],
-            value=10
-        )
-
-    # Test missing both weight_calculation_function and weights
-    with pytest.raises(OXception):
-        problem.create_constraint(variables=[var_id], value=10)
 
-    # Test providing both weight_calculation_function and weights
-    with pytest.raises(OXception):
-        problem.create_constraint(
-            variables=[var_id],
-            weight_calculation_function=lambda x, y: 1,
-            weights=[1],
-            value=10
-        )
-
-    # Test providing variable_search_function without weight_calculation_function
-    with pytest.raises(OXception):
-        problem.create_constraint(
-            variable_search_function=lambda x: True,
-            value=10
-        )
+def test_reset_reuses_problem(gp_problem):
+    """Test that a reset problem is empty and reusable."""
+    problem = gp_problem
+    problem.create_decision_variables([
+        dict(var_name="var1", upper_bound=10),
+        dict(var_name="var2", upper_bound=20),
+    ])
+    var_ids = list(problem.variables.ids())
+    problem.create_goal_constraint(variables=var_ids, weights=[1, 2], value=30)
+    problem.create_objective_function()
 
-    # Test mismatched lengths of variables and weights
-    with pytest.raises(OXception):
-        problem.create_constraint(
-            variables=[var_id],
-            weights=[1, 2],
-            value=10
-        )
+    problem.reset()
+    assert len(problem.variables) == 0
+    assert len(problem.constraints) == 0
+    assert len(problem.goal_constraints) == 0
+    assert len(problem.objective_function.variables) == 0
+    assert problem.objective_type == ObjectiveType.MINIMIZE
+
+    problem.create_decision_variable(var_name="var3")
+    var = problem.variables.last_object
+    assert problem.variables[var.id] is var
+    assert problem.variables.search(name="var1") == []
+
+
+def test_reset_clears_injected_database_in_place():
+    """Test that a database passed to the constructor is used and cleared in place."""
+    db = OXDatabase()
+    problem = OXCSPProblem(db=db)
+    problem.db.add_object(Bus(capacity=40))
+    assert len(db) == 1
+
+    problem.reset()
+    assert problem.db is db
+    assert len(db) == 0
@@ -50,6 +50,8 @@ Special Constraint Types Tested:
 
 from uuid import UUID
 
+import pytest
+
 from constraints import (
     OXSpecialConstraint,
     OXNonLinearEqualityConstraint,
@@ -61,166 +63,101 @@ from constraints import (
 )
 
 
-def test_special_constraint_initialization():
-    """Test initialization of the base OXSpecialConstraint class."""
-    constraint = OXSpecialConstraint()
-    assert constraint.class_name == "constraints.OXSpecialConstraints.OXSpecialConstraint"
-
-
-def test_non_linear_equality_constraint_initialization():
-    """Test initialization of OXNonLinearEqualityConstraint."""
-    # Default initialization
-    constraint = OXNonLinearEqualityConstraint()
-    assert constraint.class_name == "constraints.OXSpecialConstraints.OXNonLinearEqualityConstraint"
-    assert isinstance(constraint.output_variable, UUID)
-    
-    # Custom initialization
-    output_var_id = UUID("12345678-1234-5678-1234-567812345678")
-    constraint = OXNonLinearEqualityConstraint(output_variable=output_var_id)
-    assert constraint.output_variable == output_var_id
-
-
-def test_multiplicative_equality_constraint_initialization():
-    """Test initialization of OXMultiplicativeEqualityConstraint."""
-    # Default initialization
-    constraint = OXMultiplicativeEqualityConstraint()
-    assert constraint.class_name == "constraints.OXSpecialConstraints.OXMultiplicativeEqualityConstraint"
-    assert isinstance(constraint.output_variable, UUID)
-    assert isinstance(constraint.input_variables, list)
-    assert len(constraint.input_variables) == 0
-    
-    # Custom initialization
-    output_var_id = UUID("12345678-1234-5678-1234-567812345678")
-    input_var_id1 = UUID("87654321-4321-8765-4321-876543210987")
-    input_var_id2 = UUID("11111111-1111-1111-1111-111111111111")
-    
-    constraint = OXMultiplicativeEqualityConstraint(
-        output_variable=output_var_id,
-        input_variables=[input_var_id1, input_var_id2]
-    )
-    
-    assert constraint.output_variable == output_var_id
-    assert len(constraint.input_variables) == 2
-    assert input_var_id1 in constraint.input_variables
-    assert input_var_id2 in constraint.input_variables
-
-
-def test_division_equality_constraint_initialization():
-    """Test initialization of OXDivisionEqualityConstraint."""
-    # Default initialization
-    constraint = OXDivisionEqualityConstraint()
-    assert constraint.class_name == "constraints.OXSpecialConstraints.OXDivisionEqualityConstraint"
-    assert isinstance(constraint.output_variable, UUID)
-    assert isinstance(constraint.input_variable, UUID)
-    assert constraint.denominator == 1
-    
-    # Custom initialization
-    output_var_id = UUID("12345678-1234-5678-1234-567812345678")
-    input_var_id = UUID("87654321-4321-8765-4321-876543210987")
-    
-    constraint = OXDivisionEqualityConstraint(
-        output_variable=output_var_id,
-        input_variable=input_var_id,
-        denominator=5
-    )
-    
-    assert constraint.output_variable == output_var_id
-    assert constraint.input_variable == input_var_id
-    assert constraint.denominator == 5
-
-
-def test_modulo_equality_constraint_initialization():
-    """Test initialization of OXModuloEqualityConstraint."""
-    # Default initialization
-    constraint = OXModuloEqualityConstraint()
-    assert constraint.class_name == "constraints.OXSpecialConstraints.OXModuloEqualityConstraint"
-    assert isinstance(constraint.output_variable, UUID)
-    assert isinstance(constraint.input_variable, UUID)
-    assert constraint.denominator == 1
-    
-    # Custom initialization
-    output_var_id = UUID("12345678-1234-5678-1234-567812345678")
-    input_var_id = UUID("87654321-4321-8765-4321-876543210987")
-    
-    constraint = OXModuloEqualityConstraint(
-        output_variable=output_var_id,
-        input_variable=input_var_id,
-        denominator=7
-    )
-    
-    assert constraint.output_variable == output_var_id
-    assert constraint.input_variable == input_var_id
-    assert constraint.denominator == 7
-
-
-def test_summation_equality_constraint_initialization():
-    """Test initialization of OXSummationEqualityConstraint."""
-    # Default initialization
-    constraint = OXSummationEqualityConstraint()
-    assert constraint.class_name == "constraints.OXSpecialConstraints.OXSummationEqualityConstraint"
-    assert isinstance(constraint.output_variable, UUID)
-    assert isinstance(constraint.input_variables, list)
-    assert len(constraint.input_variables) == 0
-    
-    # Custom initialization
-    output_var_id = UUID("12345678-1234-5678-1234-567812345678")
-    input_var_id1 = UUID("87654321-4321-8765-4321-876543210987")
-    input_var_id2 = UUID("11111111-1111-1111-1111-111111111111")
-    
-    constraint = OXSummationEqualityConstraint(
-        output_variable=output_var_id,
-        input_variables=[input_var_id1, input_var_id2]
-    )
-    
-    assert constraint.output_variable == output_var_id
-    assert len(constraint.input_variables) == 2
-    assert input_var_id1 in constraint.input_variables
-    assert input_var_id2 in constraint.input_variables
-
-
-def test_conditional_constraint_initialization():
-    """Test initialization of OXConditionalConstraint."""
-    # Default initialization
-    constraint = OXConditionalConstraint()
-    assert constraint.class_name == "constraints.OXSpecialConstraints.OXConditionalConstraint"
-    assert isinstance(constraint.indicator_variable, UUID)
-    assert isinstance(constraint.input_constraint, UUID)
-    assert isinstance(constraint.constraint_if_true, UUID)
-    assert isinstance(constraint.constraint_if_false, UUID)
-    
-    # Custom initialization
-    indicator_var_id = UUID("12345678-1234-5678-1234-567812345678")
-    input_constraint_id = UUID("87654321-4321-8765-4321-876543210987")
-    constraint_if_true_id = UUID("11111111-1111-1111-1111-111111111111")
-    constraint_if_false_id = UUID("22222222-2222-2222-2222-222222222222")
-    
-    constraint = OXConditionalConstraint(
-        indicator_variable=indicator_var_id,
-        input_constraint=input_constraint_id,
-        constraint_if_true=constraint_if_true_id,
-        constraint_if_false=constraint_if_false_id
-    )
-    
-    assert constraint.indicator_variable == indicator_var_id
-    assert constraint.input_constraint == input_constraint_id
-    assert constraint.constraint_if_true == constraint_if_true_id
-    assert constraint.constraint_if_false == constraint_if_false_id
+_UUID_A = UUID("12345678-1234-5678-1234-567812345678")
+_UUID_B = UUID("87654321-4321-8765-4321-876543210987")
+_UUID_C = UUID("11111111-1111-1111-1111-111111111111")
+_UUID_D = UUID("22222222-2222-2222-2222-222222222222")
+
+DEFAULT_CASES = [
+    # (class, attributes expected to have a type, attributes expected to have a value)
+    (OXSpecialConstraint, {}, {}),
+    (OXNonLinearEqualityConstraint, {"output_variable": UUID}, {}),
+    (OXMultiplicativeEqualityConstraint,
+     {"output_variable": UUID, "input_variables": tuple}, {"input_variables": ()}),
+    (OXDivisionEqualityConstraint,
+     {"output_variable": UUID, "input_variable": UUID}, {"denominator": 1}),
+    (OXModuloEqualityConstraint,
+     {"output_variable": UUID, "input_variable": UUID}, {"denominator": 1}),
+    (OXSummationEqualityConstraint,
+     {"output_variable": UUID, "input_variables": tuple}, {"input_variables": ()}),
+    (OXConditionalConstraint,
+     {"indicator_variable": UUID, "input_constraint": UUID,
+      "constraint_if_true": UUID, "constraint_if_false": UUID}, {}),
+]
+
+CUSTOM_CASES = [
+    (OXNonLinearEqualityConstraint, {
+        "output_variable": _UUID_A,
+    }),
+    (OXMultiplicativeEqualityConstraint, {
+        "output_variable": _UUID_A,
+        "input_variables": (_UUID_B, _UUID_C),
+    }),
+    (OXDivisionEqualityConstraint, {
+        "output_variable": _UUID_A,
+        "input_variable": _UUID_B,
+        "denominator": 5,
+    }),
+    (OXModuloEqualityConstraint, {
+        "output_variable": _UUID_A,
+        "input_variable": _UUID_B,
+        "denominator": 7,
+    }),
+    (OXSummationEqualityConstraint, {
+        "output_variable": _UUID_A,
+        "input_variables": (_UUID_B, _UUID_C),
+    }),
+    (OXConditionalConstraint, {
+        "indicator_variable": _UUID_A,
+        "input_constraint": _UUID_B,
+        "constraint_if_true": _UUID_C,
+        "constraint_if_false": _UUID_D,
+    }),
+]
+
+
+@pytest.mark.parametrize("cls, expected_types, expected_values", DEFAULT_CASES,
+                         ids=[case[0].__name__ for case in DEFAULT_CASES])
+def test_default_initialization(cls, expected_types, expected_values):
+    """Test default initialization of each special constraint class."""
+    constraint = cls()
+    assert constraint.class_name == f"constraints.OXSpecialConstraints.{cls.__name__}"
+    for name, expected_type in expected_types.items():
+        assert isinstance(getattr(constraint, name), expected_type)
+    for name, expected_value in expected_values.items():
+        assert getattr(constraint, name) == expected_value
+
+
+@pytest.mark.parametrize("cls, kwargs", CUSTOM_CASES,
+                         ids=[case[0].__name__ for case in CUSTOM_CASES])
+def test_custom_initialization(cls, kwargs):
+    """Test that each special constraint class stores its constructor arguments."""
+    constraint = cls(**kwargs)
+    for name, expected_value in kwargs.items():
+        assert getattr(constraint, name) == expected_value
+
+
+@pytest.mark.parametrize("cls", [OXMultiplicativeEqualityConstraint, OXSummationEqualityConstraint])
+def test_input_variables_are_stored_as_tuple(cls):
+    """Test that input variables given as a list are stored as a tuple."""
+    constraint = cls(input_variables=[_UUID_B, _UUID_C])
+    assert constraint.input_variables == (_UUID_B, _UUID_C)
+
+
+EXPECTED_PARENTS = {
+    OXNonLinearEqualityConstraint: {OXSpecialConstraint},
+    OXMultiplicativeEqualityConstraint: {OXNonLinearEqualityConstraint, OXSpecialConstraint},
+    OXDivisionEqualityConstraint: {OXNonLinearEqualityConstraint, OXSpecialConstraint},
+    OXModuloEqualityConstraint: {OXNonLinearEqualityConstraint, OXSpecialConstraint},
+    OXSummationEqualityConstraint: {OXSpecialConstraint},
+    OXConditionalConstraint: {OXSpecialConstraint},
+}
 
 
 def test_inheritance_hierarchy():
     """Test the inheritance hierarchy of special constraint classes."""
-    # Test that all special constraints inherit from OXSpecialConstraint
-    assert issubclass(OXNonLinearEqualityConstraint, OXSpecialConstraint)
-    assert issubclass(OXMultiplicativeEqualityConstraint, OXNonLinearEqualityConstraint)
-    assert issubclass(OXDivisionEqualityConstraint, OXNonLinearEqualityConstraint)
-    assert issubclass(OXModuloEqualityConstraint, OXNonLinearEqualityConstraint)
-    assert issubclass(OXSummationEqualityConstraint, OXSpecialConstraint)
-    assert issubclass(OXConditionalConstraint, OXSpecialConstraint)
-    
-    # Test instance relationships
-    assert isinstance(OXMultiplicativeEqualityConstraint(), OXNonLinearEqualityConstraint)
-    assert isinstance(OXDivisionEqualityConstraint(), OXNonLinearEqualityConstraint)
-    assert isinstance(OXModuloEqualityConstraint(), OXNonLinearEqualityConstraint)
-    assert isinstance(OXNonLinearEqualityConstraint(), OXSpecialConstraint)
-    assert isinstance(OXSummationEqualityConstraint(), OXSpecialConstraint)
-    assert isinstance(OXConditionalConstraint(), OXSpecialConstraint)
\ No newline at end of file
+    for cls, parents in EXPECTED_PARENTS.items():
+        assert parents <= set(cls.__mro__), cls.__name__
+    # Summation and conditional constraints are not non-linear equalities
+    assert OXNonLinearEqualityConstraint not in OXSummationEqualityConstraint.__mro__
+    assert OXNonLinearEqualityConstraint not in OXConditionalConstraint.__mro__
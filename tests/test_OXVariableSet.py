@@ -114,3 +114,65 @@ def test_query_empty_variable_set():
     variable_set = OXVariableSet()
     result = variable_set.query(key1=uuid4())
     assert len(result) == 0
+
+
+def test_query_ignores_absent_keys_and_sees_later_edits():
+    variable_set = OXVariableSet()
+    shared, other = uuid4(), uuid4()
+    variable1 = OXVariable(name="test_var1", related_data={"key1": shared})
+    variable2 = OXVariable(name="test_var2", related_data={"key1": shared, "key2": other})
+    variable3 = OXVariable(name="test_var3", related_data={"key2": other})
+    variable_set.extend_objects([variable1, variable2, variable3])
+
+    # Keys a variable does not have are ignored, but at least one key must match
+    assert variable_set.query(key1=shared, key2=other) == [variable1, variable2, variable3]
+    assert variable_set.query(key1=shared, key2=uuid4()) == [variable1]
+    assert variable_set.query() == []
+
+    variable3.related_data["key1"] = shared
+    assert variable_set.query(key1=shared) == [variable1, variable2, variable3]
+
+
+def test_getitem_and_contains_by_uuid():
+    variable_set = OXVariableSet()
+    variable1 = OXVariable(name="test_var1")
+    variable2 = OXVariable(name="test_var2")
+    variable_set.add_object(variable1)
+    variable_set.add_object(variable2)
+    assert variable_set[variable2.id] is variable2
+    assert variable1.id in variable_set
+    variable_set.remove_object(variable1)
+    assert variable1 not in variable_set
+    assert variable_set[variable2.id] is variable2
+    with pytest.raises(OXception, match="Object not found"):
+        _ = variable_set[variable1.id]
+
+
+def test_index_follows_replaced_objects_list():
+    variable_set = OXVariableSet()
+    variable = OXVariable(name="test_var")
+    variable_set.objects = [variable]
+    assert variable_set[variable.id] is variable
+
+
+def test_bound_and_value_columns():
+    variable_set = OXVariableSet()
+    variable_set.add_object(OXVariable(name="x", lower_bound=1, upper_bound=10, value=3))
+    variable_set.add_object(OXVariable(name="y", lower_bound=2))
+    assert list(variable_set.lower_bounds()) == [1.0, 2.0]
+    assert list(variable_set.upper_bounds()) == [10.0, float("inf")]
+    values = variable_set.values()
+    assert values[0] == 3.0
+    assert values[1] != values[1]
+
+
+def test_extend_objects():
+    variable_set = OXVariableSet()
+    variables = [OXVariable(name="x"), OXVariable(name="y")]
+    variable_set.extend_objects(variables)
+    assert variable_set.objects == variables
+    assert variable_set[variables[1].id] is variables[1]
+
+    with pytest.raises(OXception, match="Only OXVariable can be added to OXVariableSet"):
+        variable_set.extend_objects([OXVariable(name="z"), OXObject()])
+    assert len(variable_set) == 2
@@ -45,99 +45,89 @@ Exception Features Tested:
     - Relative path calculation for file references
 """
 
+import pytest
+
 from src.base.OXception import OXception
 
 
 def test_initialization():
     """Test that OXception initializes with the correct message and captures context information."""
-    try:
-        # Raise an OXception with a test message
+    with pytest.raises(OXception) as excinfo:
         raise OXception("Test error message")
-    except OXception as e:
-        # Check that the message is set correctly
-        assert e.message == "Test error message"
-        
-        # Check that context information is captured
-        assert isinstance(e.line_nr, int)
-        assert isinstance(e.file_name, str)
-        assert e.method_name == "test_initialization"
-        assert isinstance(e.params, dict)
-        
-        # Check that the file name is relative to the project root
-        assert not e.file_name.startswith("/")
-        assert "tests/test_OXception.py" in e.file_name
+    e = excinfo.value
 
+    # Check that the message is set correctly
+    assert e.message == "Test error message"
 
-def test_string_representation():
-    """Test the string representation of OXception."""
-    try:
-        raise OXception("Test error message")
-    except OXception as e:
-        str_repr = str(e)
-        
-        # Check that the string representation includes all relevant information
-        assert "OXception: Test error message" in str_repr
-        assert e.file_name in str_repr
-        assert str(e.line_nr) in str_repr
-        assert e.method_name in str_repr
+    # Check that context information is captured
+    assert isinstance(e.line_nr, int)
+    assert isinstance(e.file_name, str)
+    assert e.method_name == "test_initialization"
+    assert isinstance(e.params, dict)
+
+    # Check that the file name is relative to the project root
+    assert not e.file_name.startswith("/")
+    assert "tests/test_OXception.py" in e.file_name
 
 
-def test_repr_representation():
-    """Test the repr representation of OXception."""
-    try:
+@pytest.mark.parametrize("render", [str, repr])
+def test_string_representation(render):
+    """Test that str and repr of OXception include all context information."""
+    with pytest.raises(OXception) as excinfo:
         raise OXception("Test error message")
-    except OXception as e:
-        repr_str = repr(e)
-        assert repr_str == str(e)
+    e = excinfo.value
+    str_repr = render(e)
+
+    # Check that the string representation includes all relevant information
+    assert str_repr == str(e)
+    assert "OXception: Test error message" in str_repr
+    assert e.file_name in str_repr
+    assert str(e.line_nr) in str_repr
+    assert e.method_name in str_repr
 
 
 def test_to_json():
     """Test the to_json method of OXception."""
-    try:
+    with pytest.raises(OXception) as excinfo:
         raise OXception("Test error message")
-    except OXception as e:
-        json_data = e.to_json()
-        
-        # Check that the JSON data includes all expected fields
-        assert json_data["message"] == "Test error message"
-        assert json_data["file_name"] == e.file_name
-        assert json_data["line_nr"] == e.line_nr
-        assert json_data["method_name"] == e.method_name
-        assert json_data["params"] == e.params
+    e = excinfo.value
+
+    # Check that the JSON data includes all expected fields
+    assert e.to_json() == {
+        "message": "Test error message",
+        "file_name": e.file_name,
+        "line_nr": e.line_nr,
+        "method_name": e.method_name,
+        "params": e.params,
+    }
 
 
 def test_nested_exception():
     """Test that OXception correctly captures context when raised from a nested function."""
     def nested_function():
         raise OXception("Nested error message")
-    
-    try:
+
+    with pytest.raises(OXception, match="Nested error message") as excinfo:
         nested_function()
-    except OXception as e:
-        # Check that the context information points to the nested function
-        assert e.message == "Nested error message"
-        assert e.method_name == "nested_function"
+
+    # Check that the context information points to the nested function
+    assert excinfo.value.method_name == "nested_function"
 
 
 def test_exception_inheritance():
     """Test that OXception inherits from Exception."""
-    try:
+    with pytest.raises(Exception) as excinfo:
         raise OXception("Test error message")
-    except Exception as e:
-        # Check that OXception is an instance of Exception
-        assert isinstance(e, Exception)
-        assert isinstance(e, OXception)
+    assert isinstance(excinfo.value, OXception)
 
 
 def test_exception_with_locals():
     """Test that OXception captures local variables."""
-    try:
-        local_var1 = "test value"
-        local_var2 = 42
+    local_var1 = "test value"
+    local_var2 = 42
+    with pytest.raises(OXception) as excinfo:
         raise OXception("Test error message")
-    except OXception as e:
-        # Check that local variables are captured in params
-        assert "local_var1" in e.params
-        assert e.params["local_var1"] == "test value"
-        assert "local_var2" in e.params
-        assert e.params["local_var2"] == 42
\ No newline at end of file
+
+    # Check that local variables are captured in params
+    assert excinfo.value.params["local_var1"] == local_var1
+    assert excinfo.value.params["local_var2"] == local_var2
@@ -46,38 +46,34 @@ Mathematical Features Tested:
     - Variable reference management with UUID tracking
 """
 
+from fractions import Fraction
 from uuid import UUID
 
+import pytest
+
 from src.constraints.OXpression import OXpression, get_integer_numerator_and_denominators
 from utilities.fraction import calculate_fraction
 
 
-def test_get_integer_numerator_and_denominators():
+_VAR_ID1 = UUID("12345678-1234-5678-1234-567812345678")
+_VAR_ID2 = UUID("87654321-4321-8765-4321-876543210987")
+
+
+@pytest.mark.parametrize("weights, expected_denominator, expected_numerators", [
+    # Integer values
+    ([1, 2, 3], 1, [1, 2, 3]),
+    # Simple fractions
+    ([0.5, 1.5, 2], 2, [1, 3, 4]),
+    # Mixed fractions
+    ([1/3, 2/3, 1], 3, [1, 2, 3]),
+    # Complex fractions
+    ([0.25, 0.75, 1.5], 4, [1, 3, 6]),
+    # Mixed denominators
+    ([1/2, 1/3, 1/4], 12, [6, 4, 3]),
+])
+def test_get_integer_numerator_and_denominators(weights, expected_denominator, expected_numerators):
     """Test the get_integer_numerator_and_denominators function."""
-    # Test with integer values
-    denominator, numerators = get_integer_numerator_and_denominators([1, 2, 3])
-    assert denominator == 1
-    assert numerators == [1, 2, 3]
-    
-    # Test with simple fractions
-    denominator, numerators = get_integer_numerator_and_denominators([0.5, 1.5, 2])
-    assert denominator == 2
-    assert numerators == [1, 3, 4]
-    
-    # Test with mixed fractions
-    denominator, numerators = get_integer_numerator_and_denominators([1/3, 2/3, 1])
-    assert denominator == 3
-    assert numerators == [1, 2, 3]
-    
-    # Test with complex fractions
-    denominator, numerators = get_integer_numerator_and_denominators([0.25, 0.75, 1.5])
-    assert denominator == 4
-    assert numerators == [1, 3, 6]
-    
-    # Test with mixed denominators
-    denominator, numerators = get_integer_numerator_and_denominators([1/2, 1/3, 1/4])
-    assert denominator == 12
-    assert numerators == [6, 4, 3]
+    assert get_integer_numerator_and_denominators(weights) == (expected_denominator, expected_numerators)
 
 
 def test_expression_default_initialization():
@@ -93,16 +89,14 @@ def test_expression_default_initialization():
 
 def test_expression_custom_initialization():
     """Test custom initialization of OXpression."""
-    var_id1 = UUID("12345678-1234-5678-1234-567812345678")
-    var_id2 = UUID("87654321-4321-8765-4321-876543210987")
     weights = [2, 3]
     
-    expr = OXpression(variables=[var_id1, var_id2], weights=weights)
+    expr = OXpression(variables=[_VAR_ID1, _VAR_ID2], weights=weights)
     
     # Check values
     assert len(expr.variables) == 2
-    assert var_id1 in expr.variables
-    assert var_id2 in expr.variables
+    assert _VAR_ID1 in expr.variables
+    assert _VAR_ID2 in expr.variables
     assert expr.weights == weights
 
 
@@ -113,57 +107,47 @@ def test_number_of_variables_property():
     assert expr.number_of_variables == 0
     
     # Expression with variables
-    var_id1 = UUID("12345678-1234-5678-1234-567812345678")
-    var_id2 = UUID("87654321-4321-8765-4321-876543210987")
-    expr = OXpression(variables=[var_id1, var_id2], weights=[2, 3])
+    expr = OXpression(variables=[_VAR_ID1, _VAR_ID2], weights=[2, 3])
     assert expr.number_of_variables == 2
 
 
-def test_integer_weights_property():
+INTEGER_WEIGHT_CASES = [
+    # Integer weights
+    ([1, 2, 3], 1, [1, 2, 3]),
+    # Fractional weights
+    ([0.5, 1.5, 2], 2, [1, 3, 4]),
+    # Mixed fractions
+    ([1/3, 2/3, 1], 3, [1, 2, 3]),
+]
+
+
+@pytest.mark.parametrize("weights, expected_denominator, expected_weights", INTEGER_WEIGHT_CASES)
+def test_integer_weights_property(weights, expected_denominator, expected_weights):
     """Test the integer_weights property."""
-    # Test with integer weights
-    expr = OXpression(variables=[], weights=[1, 2, 3])
-    assert expr.integer_weights == [1, 2, 3]
-    
-    # Test with fractional weights
-    expr = OXpression(variables=[], weights=[0.5, 1.5, 2])
-    assert expr.integer_weights == [1, 3, 4]
-    
-    # Test with mixed fractions
-    expr = OXpression(variables=[], weights=[1/3, 2/3, 1])
-    assert expr.integer_weights == [1, 2, 3]
+    expr = OXpression(variables=[], weights=weights)
+    assert expr.integer_weights == expected_weights
 
 
-def test_integer_denominator_property():
+@pytest.mark.parametrize("weights, expected_denominator, expected_weights", INTEGER_WEIGHT_CASES)
+def test_integer_denominator_property(weights, expected_denominator, expected_weights):
     """Test the integer_denominator property."""
-    # Test with integer weights
-    expr = OXpression(variables=[], weights=[1, 2, 3])
-    assert expr.integer_denominator == 1
-    
-    # Test with fractional weights
-    expr = OXpression(variables=[], weights=[0.5, 1.5, 2])
-    assert expr.integer_denominator == 2
-    
-    # Test with mixed fractions
-    expr = OXpression(variables=[], weights=[1/3, 2/3, 1])
-    assert expr.integer_denominator == 3
+    expr = OXpression(variables=[], weights=weights)
+    assert expr.integer_denominator == expected_denominator
 
 
 def test_iteration():
     """Test iterating over (variable, weight) pairs."""
-    var_id1 = UUID("12345678-1234-5678-1234-567812345678")
-    var_id2 = UUID("87654321-4321-8765-4321-876543210987")
     weights = [2, 3]
     
-    expr = OXpression(variables=[var_id1, var_id2], weights=weights)
+    expr = OXpression(variables=[_VAR_ID1, _VAR_ID2], weights=weights)
     
     # Collect pairs from iteration
     pairs = list(expr)
     
     # Check pairs
     assert len(pairs) == 2
-    assert (var_id1, 2) in pairs
-    assert (var_id2, 3) in pairs
+    assert (_VAR_ID1, 2) in pairs
+    assert (_VAR_ID2, 3) in pairs
 
 
 def test_empty_expression_iteration():
@@ -175,20 +159,17 @@ def test_empty_expression_iteration():
 
 def test_expression_with_unequal_variables_and_weights():
     """Test handling of expressions with unequal numbers of variables and weights."""
-    var_id1 = UUID("12345678-1234-5678-1234-567812345678")
-    var_id2 = UUID("87654321-4321-8765-4321-876543210987")
-    
     # More variables than weights
-    expr = OXpression(variables=[var_id1, var_id2], weights=[2])
+    expr = OXpression(variables=[_VAR_ID1, _VAR_ID2], weights=[2])
     pairs = list(expr)
     assert len(pairs) == 1  # Should only iterate over the pairs that have both variable and weight
-    assert pairs[0] == (var_id1, 2)
+    assert pairs[0] == (_VAR_ID1, 2)
     
     # More weights than variables
-    expr = OXpression(variables=[var_id1], weights=[2, 3])
+    expr = OXpression(variables=[_VAR_ID1], weights=[2, 3])
     pairs = list(expr)
     assert len(pairs) == 1  # Should only iterate over the pairs that have both variable and weight
-    assert pairs[0] == (var_id1, 2)
+    assert pairs[0] == (_VAR_ID1, 2)
 
 
 def test_lru_cache_for_get_integer_numerator_and_denominators():
@@ -201,11 +182,41 @@ def test_lru_cache_for_get_integer_numerator_and_denominators():
     assert result1 == result2
 
 
-def test_farey_algorithm():
-    """Test that the get_integer_numerator_and_denominators function uses LRU cache."""
-    # Call the function twice with the same arguments
-    result1 = calculate_fraction(17/28)
+@pytest.mark.parametrize("fraction_function", [calculate_fraction, calculate_fraction.__wrapped__],
+                         ids=["cached", "uncached"])
+def test_farey_algorithm(fraction_function):
+    """Test the mediant search through the cache and through the undecorated function."""
+    result1 = fraction_function(17/28)
 
     assert result1.numerator==17
     assert result1.denominator==28
 
+
+@pytest.mark.parametrize("value, expected", [
+    (1e-6, Fraction(1, 1000000)),
+    (-2.75, Fraction(-11, 4)),
+    (1234.5678, Fraction(2285185, 1851)),
+])
+def test_farey_algorithm_long_runs(value, expected):
+    """Test values whose mediant walk moves one bound for many steps in a row."""
+    assert calculate_fraction.__wrapped__(value) == expected
+
+
+def test_weights_array():
+    expr = OXpression(variables=[UUID(int=1), UUID(int=2), UUID(int=3)], weights=[1, 2.5, Fraction(1, 4)])
+    column = expr.weights_array()
+    assert column.typecode == "d"
+    assert list(column) == [1.0, 2.5, 0.25]
+    assert expr.weights == [1, 2.5, Fraction(1, 4)]
+
+
+def test_integer_form_follows_weight_changes():
+    """Test that the cached integer form is recomputed when the weights change."""
+    expr = OXpression(variables=[_VAR_ID1, _VAR_ID2], weights=[0.5, 1])
+    assert (expr.integer_denominator, expr.integer_weights) == (2, [1, 2])
+
+    expr.weights[1] = 0.25
+    assert (expr.integer_denominator, expr.integer_weights) == (4, [2, 1])
+
+    expr.integer_weights.append(99)
+    assert expr.integer_weights == [2, 1]
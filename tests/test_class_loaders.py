@@ -45,22 +45,34 @@ Class Loading Features Tested:
     - Error handling for missing or invalid classes
 """
 
+import pytest
+
+from base.OXception import OXception
 from src.utilities.class_loaders import load_class
 
 
-def test_load_class_valid_class():
+@pytest.mark.parametrize("fully_qualified_name, class_name, module_name", [
+    ("base.OXObject.OXObject", "OXObject", "base.OXObject"),
+    ("base.OXObjectPot.OXObjectPot", "OXObjectPot", "base.OXObjectPot"),
+])
+def test_load_class_valid_class(fully_qualified_name, class_name, module_name):
     # Test loading a valid class
-    clazz = load_class("base.OXObject.OXObject")
-    assert clazz.__name__ == "OXObject"
-    assert clazz.__module__ == "base.OXObject"
+    clazz = load_class(fully_qualified_name)
+    assert clazz.__name__ == class_name
+    assert clazz.__module__ == module_name
     obj = clazz()
     assert obj.id is not None
-    assert obj.class_name == "base.OXObject.OXObject"
+    assert obj.class_name == fully_qualified_name
+
 
-    clazz2 = load_class("base.OXObjectPot.OXObjectPot")
-    assert clazz2.__name__ == "OXObjectPot"
-    assert clazz2.__module__ == "base.OXObjectPot"
-    obj2 = clazz2()
-    assert obj2.id is not None
-    assert obj2.class_name == "base.OXObjectPot.OXObjectPot"
+def test_load_class_caches_only_successes():
+    assert load_class("base.OXObject.OXObject") is load_class("base.OXObject.OXObject")
+    hits = load_class.cache_info().hits
+    load_class("base.OXObject.OXObject")
+    assert load_class.cache_info().hits == hits + 1
 
+    cached = load_class.cache_info().currsize
+    for _ in range(2):
+        with pytest.raises(OXception):
+            load_class("base.OXObject.NoSuchClass")
+    assert load_class.cache_info().currsize == cached
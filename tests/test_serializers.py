@@ -49,12 +49,16 @@ Serialization Features Tested:
     - Error handling for malformed serialization data
 """
 
+import json
+from dataclasses import asdict
+
 import pytest
 
 from base import OXObject
 from base import OXObjectPot
 from base import OXception
-from serialization.serializers import serialize_to_python_dict, deserialize_from_python_dict
+from problem.OXProblem import OXLPProblem
+from serialization.serializers import serialize_to_python_dict, deserialize_from_python_dict, deserialize_from_json
 
 
 def test_serialize_to_python_dict_valid_oxobject():
@@ -74,6 +78,19 @@ def test_serialize_to_python_dict_oxobject_pot():
 
 
 
+def test_serialize_to_python_dict_matches_asdict():
+    problem = OXLPProblem()
+    problem.create_decision_variable(var_name="x", upper_bound=10)
+    problem.create_decision_variable(var_name="y", upper_bound=20)
+    problem.create_constraint(variables=[v.id for v in problem.variables], weights=[1, 2], value=5)
+    assert serialize_to_python_dict(problem) == asdict(problem)
+
+
+def test_serialize_to_python_dict_rejects_non_dataclass():
+    with pytest.raises(TypeError):
+        serialize_to_python_dict(object())
+
+
 def test_serialize_to_python_dict_unique_id():
     obj1 = OXObject()
     obj2 = OXObject()
@@ -109,10 +126,46 @@ def test_deserialize_from_python_dict_nested_object():
         "class_name": "base.OXObjectPot.OXObjectPot",
         "objects": [nested_data]
     }
-    obj = deserialize_from_python_dict(data)
-    assert isinstance(obj, OXObjectPot)
-    assert len(obj.objects) == 1
-    assert isinstance(obj.objects[0], OXObject)
-    assert str(obj.objects[0].id) == nested_data["id"]
+    for obj in (deserialize_from_json(json.dumps(data)), deserialize_from_python_dict(data)):
+        assert isinstance(obj, OXObjectPot)
+        assert len(obj.objects) == 1
+        assert isinstance(obj.objects[0], OXObject)
+        assert str(obj.objects[0].id) == nested_data["id"]
+
+
+@pytest.mark.parametrize("document", [
+    '{"id": "6f95d2fa-1b85-4ea0-a9f0-810de28633b3"}',
+    '{"id": "6f95d2fa-1b85-4ea0-a9f0-810de28633b3", "class_name": "nonexistent.ClassName"}',
+    '[]',
+])
+def test_deserialize_from_json_invalid_input(document):
+    with pytest.raises(OXception):
+        deserialize_from_json(document)
+
+
+def test_deserialize_from_json_keeps_plain_objects():
+    data = {"id": "6f95d2fa-1b85-4ea0-a9f0-810de28633b3", "class_name": "base.OXObject.OXObject",
+            "extra": {"key": "value"}}
+    obj = deserialize_from_json(json.dumps(data))
+    assert obj.extra == {"key": "value"}
+
+
+def test_deserialize_from_json_rebuilds_deeper_objects_than_python_dict():
+    nested = {"id": "6f95d2fa-1b85-4ea0-a9f0-810de28633b3", "class_name": "base.OXObject.OXObject"}
+    data = {"id": "0d3f5a51-8f4c-4f55-9a4b-2d0f3e6b8a10", "class_name": "base.OXObjectPot.OXObjectPot",
+            "objects": [[nested]], "extra": {"key": nested}}
+
+    from_json = deserialize_from_json(json.dumps(data))
+    assert isinstance(from_json.objects[0][0], OXObject)
+    assert isinstance(from_json.extra["key"], OXObject)
+
+    from_dict = deserialize_from_python_dict(json.loads(json.dumps(data)))
+    assert from_dict.objects[0][0] == nested
+    assert from_dict.extra["key"] == nested
+
 
+def test_serialize_to_python_dict_shares_class_name():
+    result1 = serialize_to_python_dict(OXObject())
+    result2 = serialize_to_python_dict(OXObject())
+    assert result1["class_name"] is result2["class_name"] is OXObject._ox_class_name
 